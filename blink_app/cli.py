@@ -1,4 +1,5 @@
 import argparse
+import functools
 
 from blink_app import __version__
 from blink_app.constants import (
@@ -7,6 +8,8 @@ from blink_app.constants import (
     ALERT_SOUND,
     EAR_CONSEC_FRAMES,
     EAR_THRESHOLD,
+    INFER_MAX_WIDTH,
+    MOTION_THRESHOLD,
 )
 
 
@@ -40,6 +43,16 @@ def positive_float(value: str) -> float:
     return fvalue
 
 
+def non_negative_float(value: str) -> float:
+    try:
+        fvalue = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid float value: {value}") from exc
+    if fvalue < 0:
+        raise argparse.ArgumentTypeError("Value must be a non-negative number.")
+    return fvalue
+
+
 def ear_threshold_value(value: str) -> float:
     fvalue = positive_float(value)
     if fvalue > 1.0:
@@ -47,7 +60,8 @@ def ear_threshold_value(value: str) -> float:
     return fvalue
 
 
-def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Detect blinks and log blink counts.")
     parser.add_argument(
         "--version",
@@ -83,6 +97,59 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Requested capture FPS (default: camera default).",
     )
+    parser.add_argument(
+        "--capture-backend",
+        choices=("auto", "gstreamer"),
+        default="auto",
+        help=(
+            "Camera backend: 'auto' tries the OpenCV backends in turn; 'gstreamer' "
+            "reads through a GStreamer pipeline that never queues more than one frame "
+            "(needs OpenCV built with GStreamer; default: auto)."
+        ),
+    )
+    parser.add_argument(
+        "--infer-fps",
+        type=positive_float,
+        default=None,
+        help=(
+            "Maximum rate of face-landmark inference; frames in between are shown "
+            "but not analyzed, and --ear-consec-frames counts analyzed frames "
+            "(default: every frame)."
+        ),
+    )
+    parser.add_argument(
+        "--infer-width",
+        type=positive_int,
+        default=INFER_MAX_WIDTH,
+        help=(
+            "Frames wider than this are downscaled before face-landmark inference; "
+            f"the preview keeps full resolution (default: {INFER_MAX_WIDTH})."
+        ),
+    )
+    parser.add_argument(
+        "--motion-threshold",
+        type=non_negative_float,
+        default=MOTION_THRESHOLD,
+        help=(
+            "Skip face-landmark inference while the area around the eyes changes less "
+            "than this mean gray level from the last analyzed frame. Saves CPU, but "
+            "quick blinks or a dim camera may be missed; 0 analyzes every frame "
+            f"(default: {MOTION_THRESHOLD})."
+        ),
+    )
+    parser.add_argument(
+        "--refine-landmarks",
+        action="store_true",
+        help=(
+            "Run FaceMesh's iris/lip refinement model as well; blink detection does "
+            "not need it and it costs an extra model pass per frame (default: off)."
+        ),
+    )
+    parser.add_argument(
+        "--no-display",
+        action="store_true",
+        help="Do not draw the camera preview; blink tracking and stats keep running.",
+    )
     parser.add_argument(
         "--csv-output",
         action="store_true",
@@ -155,4 +222,8 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         help="Disable audio alerts when no blink is detected.",
     )
     parser.set_defaults(enable_alerts=False)
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return _get_parser().parse_args(argv)
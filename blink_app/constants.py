@@ -1,5 +1,38 @@
 LEFT_EYE = [33, 160, 158, 133, 153, 144]
 RIGHT_EYE = [362, 385, 387, 263, 373, 380]
+# Only the eye landmarks are read off each frame; EAR then indexes into that
+# gathered block instead of the full face mesh.
+EYE_LANDMARKS = LEFT_EYE + RIGHT_EYE
+LEFT_EYE_POINTS = range(0, 6)
+RIGHT_EYE_POINTS = range(6, 12)
+
+# FaceMesh re-runs face detection whenever tracking confidence drops below
+# the tracking threshold, so these directly control how often the detector runs.
+FACE_DETECTION_CONFIDENCE = 0.5
+FACE_TRACKING_CONFIDENCE = 0.5
+
+# Default for --infer-width. Frames wider than this are downscaled before
+# FaceMesh; landmarks come back normalized, so they are still mapped onto the
+# full-size frame.
+INFER_MAX_WIDTH = 640
+
+# After this many analyzed frames without a face, inference drops to at most
+# one frame per NO_FACE_INFER_INTERVAL seconds until a face is found again.
+NO_FACE_BACKOFF_FRAMES = 30
+NO_FACE_INFER_INTERVAL = 0.2
+
+# Opt-in motion gate (--motion-threshold): FaceMesh is skipped, and the
+# previous EAR reused, while the mean absolute difference of a grayscale patch
+# around the eyes stays below this value (0-255 scale). A quick blink or a dim
+# camera can stay under the threshold, so it is off (0.0) by default;
+# inference is still forced after MOTION_FORCE_FRAMES reused frames in a row.
+MOTION_THRESHOLD = 0.0
+MOTION_FORCE_FRAMES = 30
+EYE_PATCH_SIZE = (48, 16)
+
+# Rows fetched per page for the per-minute table (4 hours); scrolling to the
+# bottom loads another page.
+MINUTE_TABLE_PAGE_SIZE = 240
 
 EAR_THRESHOLD = 0.21
 EAR_CONSEC_FRAMES = 3
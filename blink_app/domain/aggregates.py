@@ -1,17 +1,99 @@
 import argparse
+import atexit
 import csv
 import logging
 import os
 import sqlite3
-from dataclasses import dataclass
+from bisect import bisect_left, insort
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from typing import Any, TextIO
 
 from blink_app.services.alert import play_alert_sound
 from blink_app.constants import ALERT_NO_BLINK_SECONDS, ALERT_REPEAT_SECONDS
-from blink_app.services.db import count_blinks_in_range, record_aggregate
+from blink_app.services.db import (
+    count_blinks_from_aggregate,
+    count_blinks_in_range,
+    fetch_blink_times,
+    fill_minute_rollups,
+    flush_blink_events,
+    format_timestamp,
+    record_aggregate,
+)
 from blink_app.domain.detection import BlinkState
 
 
+@dataclass
+class BlinkTimeline:
+    """Sorted blink times, complete for every instant from ``start`` onwards."""
+
+    start: datetime
+    times: list[datetime] = field(default_factory=list)
+
+    def covers(self, start: datetime) -> bool:
+        return start >= self.start
+
+    def extend(self, blink_times: deque[datetime]) -> None:
+        while blink_times:
+            # insort keeps the list ordered even if the wall clock steps back.
+            insort(self.times, blink_times.popleft())
+
+    def count(self, start: datetime, end: datetime) -> int:
+        """Return the number of blinks in the half-open range [start, end)."""
+        return bisect_left(self.times, end) - bisect_left(self.times, start)
+
+    def prune(self, before: datetime) -> None:
+        del self.times[: bisect_left(self.times, before)]
+        self.start = max(self.start, before)
+
+
+@dataclass(frozen=True)
+class AggregateSettings:
+    """Options read by every stats tick, resolved once from the CLI arguments."""
+
+    csv_output: bool
+    enable_alerts: bool
+    alert_after_seconds: float
+    alert_repeat_seconds: float
+    alert_sound: str
+    alert_sound_file: str | None
+    minute_csv_path: str
+    ten_minute_csv_path: str
+    hour_csv_path: str
+    day_csv_path: str
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace, output_dir: str) -> "AggregateSettings":
+        alert_sound = str(getattr(args, "alert_sound", "exclamation"))
+        alert_sound_file = getattr(args, "alert_sound_file", None)
+        # Alerts with no sound to play are treated as disabled, so a silent
+        # configuration costs one attribute check per tick.
+        alerts_audible = bool(alert_sound_file) or (
+            bool(alert_sound) and alert_sound.lower() != "none"
+        )
+        return cls(
+            csv_output=bool(args.csv_output),
+            enable_alerts=bool(getattr(args, "enable_alerts", False)) and alerts_audible,
+            alert_after_seconds=max(
+                0.1,
+                float(getattr(args, "alert_after_seconds", ALERT_NO_BLINK_SECONDS)),
+            ),
+            # update_aggregates executes at most once per second, so values below
+            # one second only increase alert churn without practical benefit.
+            alert_repeat_seconds=max(
+                1.0,
+                float(getattr(args, "alert_repeat_seconds", ALERT_REPEAT_SECONDS)),
+            ),
+            alert_sound=alert_sound,
+            alert_sound_file=alert_sound_file,
+            minute_csv_path=os.path.join(output_dir, "blinks_per_minute.csv"),
+            ten_minute_csv_path=os.path.join(output_dir, "blinks_per_10_minutes.csv"),
+            hour_csv_path=os.path.join(output_dir, "blinks_per_hour.csv"),
+            day_csv_path=os.path.join(output_dir, "blinks_per_day.csv"),
+        )
+
+
 @dataclass
 class AggregateState:
     last_stats_time: float
@@ -25,15 +107,54 @@ class AggregateState:
     blinks_10m: int = 0
     blinks_1h: int = 0
     blinks_day: int = 0
+    timeline: BlinkTimeline | None = None
+    last_csv_flush: float = 0.0
+    # Resolved from args on the first tick when the caller does not set it.
+    settings: AggregateSettings | None = None
+
+
+CSV_FLUSH_SECONDS = 60.0
+
+# CSV files stay open for the whole session; rows accumulate in a 64 KiB
+# buffer that is flushed periodically and on exit instead of per row.
+_csv_writers: dict[str, tuple[TextIO, Any]] = {}
 
 
 def write_csv_row(path: str, headers: list[str], row: list[object]) -> None:
-    with open(path, "a", newline="", encoding="utf-8") as csvfile:
+    entry = _csv_writers.get(path)
+    if entry is None:
+        csvfile = open(path, "a", newline="", encoding="utf-8", buffering=1 << 16)
         writer = csv.writer(csvfile)
         # Write headers if the file is empty (new or truncated).
         if csvfile.tell() == 0:
             writer.writerow(headers)
-        writer.writerow(row)
+        entry = _csv_writers[path] = (csvfile, writer)
+    entry[1].writerow(row)
+
+
+def flush_csv_writers() -> None:
+    for csvfile, _ in _csv_writers.values():
+        csvfile.flush()
+
+
+def close_csv_writers() -> None:
+    while _csv_writers:
+        _, (csvfile, _) = _csv_writers.popitem()
+        csvfile.close()
+
+
+atexit.register(close_csv_writers)
+
+
+def _count_blinks(
+    timeline: BlinkTimeline,
+    db_conn: sqlite3.Connection,
+    start: datetime,
+    end: datetime,
+) -> int:
+    if timeline.covers(start):
+        return timeline.count(start, end)
+    return count_blinks_in_range(db_conn, start, end - timedelta(seconds=1))
 
 
 def update_aggregates(
@@ -49,139 +170,198 @@ def update_aggregates(
     if now_ts - state.last_stats_time < 1.0:
         return
     state.last_stats_time = now_ts
+    flush_blink_events(db_conn, force=False)
+
+    settings = state.settings
+    if settings is None:
+        settings = state.settings = AggregateSettings.from_args(args, output_dir)
+
+    if (
+        settings.enable_alerts
+        and now_ts - blink_state.last_blink_time >= settings.alert_after_seconds
+        and now_ts - state.last_alert_time >= settings.alert_repeat_seconds
+    ):
+        logging.getLogger("app").warning(
+            "No blink detected for %ds. Playing alert.",
+            int(now_ts - blink_state.last_blink_time),
+        )
+        play_alert_sound(sound=settings.alert_sound, sound_file=settings.alert_sound_file)
+        state.last_alert_time = now_ts
 
-    if getattr(args, "enable_alerts", False):
-        alert_after_seconds = max(
-            0.1,
-            float(getattr(args, "alert_after_seconds", ALERT_NO_BLINK_SECONDS)),
-        )
-        # update_aggregates executes at most once per second, so values below
-        # one second only increase alert churn without practical benefit.
-        alert_repeat_seconds = max(
-            1.0,
-            float(getattr(args, "alert_repeat_seconds", ALERT_REPEAT_SECONDS)),
-        )
-        if (
-            now_ts - blink_state.last_blink_time >= alert_after_seconds
-            and now_ts - state.last_alert_time >= alert_repeat_seconds
-        ):
-            alert_sound = getattr(args, "alert_sound", "exclamation")
-            alert_sound_file = getattr(args, "alert_sound_file", None)
-            if alert_sound_file or (alert_sound and str(alert_sound).lower() != "none"):
-                logging.getLogger("app").warning(
-                    "No blink detected for %ds. Playing alert.",
-                    int(now_ts - blink_state.last_blink_time),
-                )
-                play_alert_sound(sound=str(alert_sound), sound_file=alert_sound_file)
-                state.last_alert_time = now_ts
-
-    date_str = now_dt.strftime("%Y-%m-%d")
+    if now_ts - state.last_csv_flush >= CSV_FLUSH_SECONDS:
+        flush_csv_writers()
+        state.last_csv_flush = now_ts
+
+    # Every interval boundary below is a whole minute, so nothing past this
+    # point can change until the wall-clock minute rolls over.
+    current_minute_for_day = now_dt.replace(second=0, microsecond=0)
+    if state.last_current_day_update == current_minute_for_day:
+        return
+
+    date_str = now_dt.date().isoformat()
+    current_day_start = current_minute_for_day.replace(hour=0, minute=0)
+    previous_day_start = current_day_start - timedelta(days=1)
+
+    # Counts are served from memory; SQLite is only read once to seed the
+    # timeline with today's blinks recorded before this state was created.
+    # Windows that start before the seed (yesterday, right after midnight)
+    # are answered by SQLite instead.
+    if state.timeline is None:
+        state.timeline = BlinkTimeline(
+            current_day_start,
+            fetch_blink_times(db_conn, current_day_start),
+        )
+        blink_state.blink_times.clear()
+    else:
+        state.timeline.extend(blink_state.blink_times)
+    state.timeline.prune(previous_day_start)
+    timeline = state.timeline
 
     # FULL MINUTE LOG
-    current_minute = now_dt.replace(second=0, microsecond=0) - timedelta(minutes=1)
+    current_minute = current_minute_for_day - timedelta(minutes=1)
+    # Minutes missed while the app was starting or not ticking (suspend, a
+    # stalled camera) are backfilled in one grouped query.
+    if state.last_logged_minute is None:
+        fill_minute_rollups(db_conn, current_day_start, current_minute)
+    elif current_minute - state.last_logged_minute > timedelta(minutes=1):
+        fill_minute_rollups(
+            db_conn,
+            state.last_logged_minute + timedelta(minutes=1),
+            current_minute,
+        )
     if state.last_logged_minute != current_minute:
+        minute_start_str = format_timestamp(current_minute)
         minute_end = current_minute + timedelta(minutes=1) - timedelta(seconds=1)
-        state.blinks_1m = count_blinks_in_range(db_conn, current_minute, minute_end)
+        state.blinks_1m = _count_blinks(
+            timeline,
+            db_conn,
+            current_minute,
+            current_minute + timedelta(minutes=1),
+        )
         aggregate_logger.info(
             "minute_interval start=%s blinks=%d",
-            current_minute.strftime("%Y-%m-%d %H:%M:%S"),
+            minute_start_str,
             state.blinks_1m,
         )
-        record_aggregate(db_conn, "minute", current_minute, minute_end, state.blinks_1m)
-        if args.csv_output:
+        record_aggregate(
+            db_conn,
+            "minute",
+            minute_start_str,
+            format_timestamp(minute_end),
+            state.blinks_1m,
+        )
+        if settings.csv_output:
             write_csv_row(
-                os.path.join(output_dir, "blinks_per_minute.csv"),
+                settings.minute_csv_path,
                 ["date", "interval_start", "blinks"],
-                [date_str, current_minute.strftime("%H:%M:%S"), state.blinks_1m],
+                [date_str, minute_start_str[11:], state.blinks_1m],
             )
         state.last_logged_minute = current_minute
 
     # FULL 10-MINUTE LOG
     minute_mod = now_dt.minute % 10
-    current_10minute = now_dt.replace(
-        minute=now_dt.minute - minute_mod,
-        second=0,
-        microsecond=0,
-    ) - timedelta(minutes=10)
+    current_10minute = current_minute_for_day - timedelta(minutes=minute_mod + 10)
     if state.last_logged_10minute != current_10minute:
+        ten_minute_start_str = format_timestamp(current_10minute)
         ten_minute_end = current_10minute + timedelta(minutes=10) - timedelta(seconds=1)
-        state.blinks_10m = count_blinks_in_range(db_conn, current_10minute, ten_minute_end)
+        state.blinks_10m = _count_blinks(
+            timeline,
+            db_conn,
+            current_10minute,
+            current_10minute + timedelta(minutes=10),
+        )
         aggregate_logger.info(
             "ten_minute_interval start=%s blinks=%d",
-            current_10minute.strftime("%Y-%m-%d %H:%M:%S"),
+            ten_minute_start_str,
             state.blinks_10m,
         )
         record_aggregate(
             db_conn,
             "ten_minute",
-            current_10minute,
-            ten_minute_end,
+            ten_minute_start_str,
+            format_timestamp(ten_minute_end),
             state.blinks_10m,
         )
-        if args.csv_output:
+        if settings.csv_output:
             write_csv_row(
-                os.path.join(output_dir, "blinks_per_10_minutes.csv"),
+                settings.ten_minute_csv_path,
                 ["date", "interval_start", "blinks"],
-                [date_str, current_10minute.strftime("%H:%M:%S"), state.blinks_10m],
+                [date_str, ten_minute_start_str[11:], state.blinks_10m],
             )
         state.last_logged_10minute = current_10minute
 
     # FULL HOUR LOG
-    current_hour = now_dt.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+    current_hour = current_minute_for_day.replace(minute=0) - timedelta(hours=1)
     if state.last_logged_hour != current_hour:
+        hour_start_str = format_timestamp(current_hour)
         hour_end = current_hour + timedelta(hours=1) - timedelta(seconds=1)
-        state.blinks_1h = count_blinks_in_range(db_conn, current_hour, hour_end)
+        state.blinks_1h = _count_blinks(
+            timeline,
+            db_conn,
+            current_hour,
+            current_hour + timedelta(hours=1),
+        )
         aggregate_logger.info(
             "hour_interval start=%s blinks=%d",
-            current_hour.strftime("%Y-%m-%d %H:%M:%S"),
+            hour_start_str,
+            state.blinks_1h,
+        )
+        record_aggregate(
+            db_conn,
+            "hour",
+            hour_start_str,
+            format_timestamp(hour_end),
             state.blinks_1h,
         )
-        record_aggregate(db_conn, "hour", current_hour, hour_end, state.blinks_1h)
-        if args.csv_output:
+        if settings.csv_output:
             write_csv_row(
-                os.path.join(output_dir, "blinks_per_hour.csv"),
+                settings.hour_csv_path,
                 ["date", "interval_start", "blinks"],
-                [date_str, current_hour.strftime("%H:%M:%S"), state.blinks_1h],
+                [date_str, hour_start_str[11:], state.blinks_1h],
             )
         state.last_logged_hour = current_hour
 
     # DAILY LOG (aggregate previous full day, show current day total)
-    current_day_start = now_dt.replace(hour=0, minute=0, second=0, microsecond=0)
-    previous_day_start = current_day_start - timedelta(days=1)
     if state.last_logged_day != previous_day_start:
+        previous_day_start_str = format_timestamp(previous_day_start)
         previous_day_end = current_day_start - timedelta(seconds=1)
-        previous_day_total = count_blinks_in_range(
-            db_conn,
-            previous_day_start,
-            previous_day_end,
-        )
+        previous_day_total = None
+        if not timeline.covers(previous_day_start):
+            # A stored day rollup is final: it is only written once the day is over.
+            previous_day_total = count_blinks_from_aggregate(
+                db_conn,
+                "day",
+                previous_day_start,
+                current_day_start,
+            )
+        if previous_day_total is None:
+            previous_day_total = _count_blinks(
+                timeline,
+                db_conn,
+                previous_day_start,
+                current_day_start,
+            )
         aggregate_logger.info(
             "day_interval start=%s blinks=%d",
-            previous_day_start.strftime("%Y-%m-%d %H:%M:%S"),
+            previous_day_start_str,
             previous_day_total,
         )
         record_aggregate(
             db_conn,
             "day",
-            previous_day_start,
-            previous_day_end,
+            previous_day_start_str,
+            format_timestamp(previous_day_end),
             previous_day_total,
         )
         state.last_logged_day = previous_day_start
 
-    # Update current day total every minute to avoid excessive DB queries and CSV writes
-    current_minute_for_day = now_dt.replace(second=0, microsecond=0)
-    if state.last_current_day_update != current_minute_for_day:
-        state.blinks_day = count_blinks_in_range(
-            db_conn,
-            current_day_start,
-            now_dt,
+    # Update current day total every minute to avoid excessive CSV writes
+    state.blinks_day = timeline.count(current_day_start, now_dt + timedelta(seconds=1))
+    aggregate_logger.info("daily_total date=%s blinks=%d", date_str, state.blinks_day)
+    if settings.csv_output:
+        write_csv_row(
+            settings.day_csv_path,
+            ["date", "blinks"],
+            [date_str, state.blinks_day],
         )
-        aggregate_logger.info("daily_total date=%s blinks=%d", date_str, state.blinks_day)
-        if args.csv_output:
-            write_csv_row(
-                os.path.join(output_dir, "blinks_per_day.csv"),
-                ["date", "blinks"],
-                [date_str, state.blinks_day],
-            )
-        state.last_current_day_update = current_minute_for_day
+    state.last_current_day_update = current_minute_for_day
@@ -1,7 +1,8 @@
 import logging
 import math
 import sqlite3
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from collections.abc import Sequence
 
@@ -12,19 +13,15 @@ def eye_aspect_ratio(
     landmarks: Sequence[tuple[float, float]],
     eye_indices: Sequence[int],
 ) -> float:
-    def euclidean(p1: tuple[float, float], p2: tuple[float, float]) -> float:
-        return math.dist(p1, p2)
-
-    p = [landmarks[i] for i in eye_indices]
-    A = euclidean(p[1], p[5])
-    B = euclidean(p[2], p[4])
-    C = euclidean(p[0], p[3])
+    i0, i1, i2, i3, i4, i5 = eye_indices
+    C = math.dist(landmarks[i0], landmarks[i3])
     if C <= 1e-9:
         # Degenerate eye geometry can occur on bad/partial landmark frames.
         # Returning a high EAR avoids false blink triggers and prevents crashes.
         return 1.0
-    ear = (A + B) / (2.0 * C)
-    return ear
+    A = math.dist(landmarks[i1], landmarks[i5])
+    B = math.dist(landmarks[i2], landmarks[i4])
+    return (A + B) / (2.0 * C)
 
 
 @dataclass
@@ -32,6 +29,8 @@ class BlinkState:
     frame_counter: int = 0
     blink_counter: int = 0
     last_blink_time: float = 0.0
+    # Blinks not yet consumed by the aggregator; drained once per stats tick.
+    blink_times: deque[datetime] = field(default_factory=deque)
 
     def update(
         self,
@@ -51,4 +50,5 @@ class BlinkState:
                 self.last_blink_time = now_ts
                 blink_logger.info("Blink #%d", self.blink_counter)
                 record_blink_event(db_conn, now_dt)
+                self.blink_times.append(now_dt)
             self.frame_counter = 0
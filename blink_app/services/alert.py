@@ -1,3 +1,4 @@
+import functools
 import os
 import platform
 import shutil
@@ -5,38 +6,102 @@ import subprocess
 import sys
 import threading
 
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
+_SYSTEM = platform.system()
+# Resolved once: PATH lookups do not change while the app runs.
+_PLAYER_PATHS: dict[str, str | None] = {
+    name: shutil.which(name) for name in ("afplay", "paplay", "aplay")
+}
+
 _ALERT_THREAD_LOCK = threading.Lock()
 _ALERT_THREAD: threading.Thread | None = None
 
 _ALERT_PROCESS_LOCK = threading.Lock()
+_ALERT_PID: int | None = None
 _ALERT_PROCESS: subprocess.Popen | None = None
 
 
-def _start_alert_process(command: list[str]) -> bool:
-    global _ALERT_PROCESS
+def _alert_process_running() -> bool:
+    global _ALERT_PID
+
+    if _ALERT_PROCESS is not None:
+        return _ALERT_PROCESS.poll() is None
+    if _ALERT_PID is None:
+        return False
+    try:
+        pid, _ = os.waitpid(_ALERT_PID, os.WNOHANG)
+    except ChildProcessError:
+        pid = _ALERT_PID
+    if pid == 0:
+        return True
+    _ALERT_PID = None
+    return False
+
+
+def _start_alert_process(player: str, sound_path: str) -> bool:
+    global _ALERT_PID, _ALERT_PROCESS
+
+    executable = _PLAYER_PATHS.get(player)
+    if executable is None:
+        return False
 
     with _ALERT_PROCESS_LOCK:
-        if _ALERT_PROCESS is not None and _ALERT_PROCESS.poll() is None:
+        if _alert_process_running():
             return True
 
         try:
-            _ALERT_PROCESS = subprocess.Popen(
-                command,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            if hasattr(os, "posix_spawn"):
+                # posix_spawn returns as soon as the player is exec'd, without
+                # duplicating this process's page tables or holding a thread.
+                _ALERT_PID = os.posix_spawn(
+                    executable,
+                    [player, sound_path],
+                    os.environ,
+                    file_actions=[
+                        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+                    ],
+                )
+                _ALERT_PROCESS = None
+            else:
+                _ALERT_PROCESS = subprocess.Popen(
+                    [executable, sound_path],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
         except OSError:
             return False
 
     return True
 
 
+def _beep_async() -> None:
+    global _ALERT_THREAD
+
+    def _beep() -> None:
+        winsound.Beep(1100, 180)
+        winsound.Beep(850, 180)
+
+    # winsound.Beep blocks, so it is the only backend that needs a thread.
+    beep_thread = threading.Thread(target=_beep, daemon=True)
+    with _ALERT_THREAD_LOCK:
+        if _ALERT_THREAD is not None and _ALERT_THREAD.is_alive():
+            return
+        _ALERT_THREAD = beep_thread
+    beep_thread.start()
+
+
 def play_alert_sound(sound: str = "exclamation", sound_file: str | None = None) -> None:
     """
     Play an alert sound asynchronously using a best-effort, platform-specific backend.
 
-    The sound is played in a separate daemon thread so that calls to this function
-    are non-blocking and do not interrupt the main video-processing loop.
+    Players are spawned without waiting for them and Windows sounds use the async
+    ``winsound`` flags, so calls to this function are non-blocking and do not
+    interrupt the main video-processing loop.
 
     Platform behavior:
       * Windows:
@@ -54,135 +119,125 @@ def play_alert_sound(sound: str = "exclamation", sound_file: str | None = None)
     when supported.
     """
 
-    global _ALERT_THREAD
-
     sound = (sound or "exclamation").strip().lower()
     sound_file = sound_file.strip() if isinstance(sound_file, str) else None
 
-    def _play() -> None:
-        if sound in {"none", "off", "disabled"}:
-            return
+    if sound in {"none", "off", "disabled"}:
+        return
+
+    if _SYSTEM == "Windows" and _play_windows_sound(sound, sound_file):
+        return
+
+    command = _resolve_alert_command(sound, sound_file)
+    if command is not None and _start_alert_process(*command):
+        return
 
-        system = platform.system()
-        custom_path = None
-        if sound_file:
-            candidate = os.path.expanduser(sound_file)
-            if os.path.exists(candidate):
-                custom_path = candidate
-
-        if custom_path is not None:
-            if system == "Windows":
-                try:
-                    import winsound
-
-                    winsound.PlaySound(
-                        custom_path,
-                        winsound.SND_FILENAME | winsound.SND_ASYNC,
-                    )
-                    return
-                except Exception:
-                    pass
-
-            if system == "Darwin" and shutil.which("afplay"):
-                if _start_alert_process(["afplay", custom_path]):
-                    return
-
-            if shutil.which("paplay"):
-                if _start_alert_process(["paplay", custom_path]):
-                    return
-
-            if shutil.which("aplay"):
-                if _start_alert_process(["aplay", custom_path]):
-                    return
-
-        if system == "Windows":
+    sys.stdout.write("\a")
+    sys.stdout.flush()
+
+
+def _play_windows_sound(sound: str, sound_file: str | None) -> bool:
+    if winsound is None:
+        return False
+
+    if sound_file:
+        custom_path = os.path.expanduser(sound_file)
+        if os.path.exists(custom_path):
+            try:
+                winsound.PlaySound(
+                    custom_path,
+                    winsound.SND_FILENAME | winsound.SND_ASYNC,
+                )
+                return True
+            except Exception:
+                pass
+
+    try:
+        alias_map: dict[str, tuple[str, int]] = {
+            "exclamation": ("SystemExclamation", winsound.MB_ICONEXCLAMATION),
+            "asterisk": ("SystemAsterisk", winsound.MB_ICONASTERISK),
+            "hand": ("SystemHand", winsound.MB_ICONHAND),
+            "question": ("SystemQuestion", winsound.MB_ICONQUESTION),
+        }
+
+        if sound in alias_map:
+            alias, message_beep_kind = alias_map[sound]
             try:
-                import winsound
-
-                alias_map: dict[str, tuple[str, int]] = {
-                    "exclamation": ("SystemExclamation", winsound.MB_ICONEXCLAMATION),
-                    "asterisk": ("SystemAsterisk", winsound.MB_ICONASTERISK),
-                    "hand": ("SystemHand", winsound.MB_ICONHAND),
-                    "question": ("SystemQuestion", winsound.MB_ICONQUESTION),
-                }
-
-                if sound in alias_map:
-                    alias, message_beep_kind = alias_map[sound]
-                    try:
-                        winsound.PlaySound(
-                            alias,
-                            winsound.SND_ALIAS | winsound.SND_ASYNC,
-                        )
-                        return
-                    except Exception:
-                        pass
-
-                    try:
-                        winsound.MessageBeep(message_beep_kind)
-                        return
-                    except Exception:
-                        pass
-
-                if sound == "beep":
-                    winsound.Beep(1100, 180)
-                    winsound.Beep(850, 180)
-                    return
-
-                try:
-                    winsound.MessageBeep()
-                    return
-                except Exception:
-                    pass
+                winsound.PlaySound(
+                    alias,
+                    winsound.SND_ALIAS | winsound.SND_ASYNC,
+                )
+                return True
             except Exception:
                 pass
 
-        if system == "Darwin":
-            mac_sounds: dict[str, str] = {
-                "glass": "Glass.aiff",
-                "ping": "Ping.aiff",
-                "pop": "Pop.aiff",
-                "basso": "Basso.aiff",
-                "tink": "Tink.aiff",
-                "submarine": "Submarine.aiff",
-            }
-            mac_sound = os.path.join(
-                "/System/Library/Sounds",
-                mac_sounds.get(sound, "Glass.aiff"),
+            try:
+                winsound.MessageBeep(message_beep_kind)
+                return True
+            except Exception:
+                pass
+
+        if sound == "beep":
+            _beep_async()
+            return True
+
+        try:
+            winsound.MessageBeep()
+            return True
+        except Exception:
+            pass
+    except Exception:
+        pass
+    return False
+
+
+@functools.cache
+def _resolve_alert_command(sound: str, sound_file: str | None) -> tuple[str, str] | None:
+    # The player binaries and sound files do not change while the app runs,
+    # so the probing below happens once per (sound, sound_file) pair.
+    candidates: list[tuple[str, str]] = []
+
+    if sound_file:
+        custom_path = os.path.expanduser(sound_file)
+        if _SYSTEM == "Darwin":
+            candidates.append(("afplay", custom_path))
+        candidates += [("paplay", custom_path), ("aplay", custom_path)]
+
+    if _SYSTEM == "Darwin":
+        mac_sounds: dict[str, str] = {
+            "glass": "Glass.aiff",
+            "ping": "Ping.aiff",
+            "pop": "Pop.aiff",
+            "basso": "Basso.aiff",
+            "tink": "Tink.aiff",
+            "submarine": "Submarine.aiff",
+        }
+        candidates.append(
+            (
+                "afplay",
+                os.path.join(
+                    "/System/Library/Sounds",
+                    mac_sounds.get(sound, "Glass.aiff"),
+                ),
             )
-            if shutil.which("afplay") and os.path.exists(mac_sound):
-                if _start_alert_process(["afplay", mac_sound]):
-                    return
-
-        if shutil.which("paplay"):
-            preferred = {
-                "exclamation": "/usr/share/sounds/freedesktop/stereo/dialog-warning.oga",
-                "asterisk": "/usr/share/sounds/freedesktop/stereo/complete.oga",
-                "hand": "/usr/share/sounds/freedesktop/stereo/dialog-error.oga",
-                "question": "/usr/share/sounds/freedesktop/stereo/message.oga",
-                "beep": "/usr/share/sounds/freedesktop/stereo/bell.oga",
-            }.get(sound)
-            candidates = [preferred] if preferred else []
-            candidates += [
-                "/usr/share/sounds/freedesktop/stereo/alarm-clock-elapsed.oga",
-                "/usr/share/sounds/freedesktop/stereo/complete.oga",
-            ]
-            for sound_path in candidates:
-                if sound_path and os.path.exists(sound_path):
-                    if _start_alert_process(["paplay", sound_path]):
-                        return
-
-        if shutil.which("aplay"):
-            for sound_path in ("/usr/share/sounds/alsa/Front_Center.wav",):
-                if os.path.exists(sound_path):
-                    if _start_alert_process(["aplay", sound_path]):
-                        return
-
-        sys.stdout.write("\a")
-        sys.stdout.flush()
-
-    alert_thread = threading.Thread(target=_play, daemon=True)
-    with _ALERT_THREAD_LOCK:
-        if _ALERT_THREAD is not None and _ALERT_THREAD.is_alive():
-            return
-        _ALERT_THREAD = alert_thread
-    alert_thread.start()
+        )
+
+    preferred = {
+        "exclamation": "/usr/share/sounds/freedesktop/stereo/dialog-warning.oga",
+        "asterisk": "/usr/share/sounds/freedesktop/stereo/complete.oga",
+        "hand": "/usr/share/sounds/freedesktop/stereo/dialog-error.oga",
+        "question": "/usr/share/sounds/freedesktop/stereo/message.oga",
+        "beep": "/usr/share/sounds/freedesktop/stereo/bell.oga",
+    }.get(sound)
+    if preferred:
+        candidates.append(("paplay", preferred))
+    candidates += [
+        ("paplay", "/usr/share/sounds/freedesktop/stereo/alarm-clock-elapsed.oga"),
+        ("paplay", "/usr/share/sounds/freedesktop/stereo/complete.oga"),
+        ("aplay", "/usr/share/sounds/alsa/Front_Center.wav"),
+    ]
+
+    for player, sound_path in candidates:
+        if _PLAYER_PATHS[player] and os.path.exists(sound_path):
+            return player, sound_path
+    return None
@@ -1,14 +1,201 @@
+import logging
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def init_db(db_path: str) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path, timeout=30.0)
+BLINK_EVENT_FLUSH_SIZE = 32
+BLINK_EVENT_FLUSH_SECONDS = 2.0
+
+# SQL text is kept in module constants so every call reuses the same string
+# and hits the connection's prepared statement cache.
+INSERT_BLINK_EVENT_SQL = "INSERT INTO blink_events (event_time) VALUES (?)"
+
+# idx_blink_events_time covers event_time, so this is an index-only range scan;
+# the half-open upper bound stops the scan at the first row past the range.
+COUNT_BLINKS_SQL = """
+    SELECT COUNT(*)
+    FROM blink_events INDEXED BY idx_blink_events_time
+    WHERE event_time >= ? AND event_time < ?
+"""
+
+FETCH_BLINK_TIMES_SQL = (
+    "SELECT event_time FROM blink_events WHERE event_time >= ? ORDER BY event_time"
+)
+
+UPSERT_AGGREGATE_SQL = """
+    INSERT INTO blink_aggregates (
+        interval_type,
+        interval_start,
+        interval_end,
+        blink_count
+    )
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(interval_type, interval_start)
+    DO UPDATE SET blink_count = excluded.blink_count, interval_end = excluded.interval_end
+"""
+
+# Backfills every non-empty minute of a range with one grouped index scan
+# instead of one COUNT per minute.
+FILL_MINUTE_ROLLUPS_SQL = """
+    INSERT INTO blink_aggregates (
+        interval_type,
+        interval_start,
+        interval_end,
+        blink_count
+    )
+    SELECT
+        'minute',
+        strftime('%Y-%m-%d %H:%M:00', event_time) AS minute_start,
+        datetime(strftime('%Y-%m-%d %H:%M:00', event_time), '+59 seconds'),
+        COUNT(*)
+    FROM blink_events INDEXED BY idx_blink_events_time
+    WHERE event_time >= ? AND event_time < ?
+    GROUP BY minute_start
+    ON CONFLICT(interval_type, interval_start)
+    DO UPDATE SET blink_count = excluded.blink_count, interval_end = excluded.interval_end
+"""
+
+SUM_AGGREGATES_SQL = """
+    SELECT COUNT(*), COALESCE(SUM(blink_count), 0)
+    FROM blink_aggregates
+    WHERE interval_type = ? AND interval_start >= ? AND interval_start < ?
+"""
+
+FETCH_RECENT_AGGREGATES_SQL = """
+    SELECT interval_start, blink_count
+    FROM blink_aggregates
+    WHERE interval_type = ?
+    ORDER BY interval_start DESC
+    LIMIT ?
+"""
+
+
+class BlinkConnection(sqlite3.Connection):
+    """SQLite connection that buffers blink event inserts between commits."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.pending_events: list[tuple[str]] = []
+        self.pending_lock = threading.Lock()
+        self.last_flush = time.monotonic()
+        self.event_writer: BlinkEventWriter | None = None
+
+    def close(self) -> None:
+        if self.event_writer is not None:
+            self.event_writer.close()
+            self.event_writer = None
+        flush_blink_events(self)
+        super().close()
+
+
+class BlinkEventWriter:
+    """Commits a connection's buffered blink events from a background thread.
+
+    The writer owns a second connection, so the inserts never share a
+    transaction with statements issued on the caller's connection; WAL lets
+    the caller keep reading while a batch commits.
+    """
+
+    def __init__(self, source: BlinkConnection, db_path: str) -> None:
+        self.source = source
+        self.conn = sqlite3.connect(
+            db_path,
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        # Held across take-and-write so a reader's forced flush waits for an
+        # in-flight batch instead of overtaking it.
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread = threading.Thread(
+            target=self._run,
+            name="blink-event-writer",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def flush(self) -> None:
+        with self.lock:
+            pending = _take_pending_events(self.source)
+            if not pending:
+                return
+            try:
+                with transaction(self.conn):
+                    self.conn.executemany(INSERT_BLINK_EVENT_SQL, pending)
+            except BaseException:
+                with self.source.pending_lock:
+                    self.source.pending_events[:0] = pending
+                raise
+
+    def close(self) -> None:
+        self.stopping = True
+        self.wake.set()
+        self.thread.join()
+        self.flush()
+        self.conn.close()
+
+    def _run(self) -> None:
+        while True:
+            self.wake.wait(BLINK_EVENT_FLUSH_SECONDS)
+            self.wake.clear()
+            if self.stopping:
+                return
+            try:
+                self.flush()
+            except sqlite3.Error:
+                logging.getLogger("app").exception(
+                    "Failed to write blink events; retrying on the next flush."
+                )
+
+
+def format_timestamp(value: datetime | str) -> str:
+    # Callers that already hold the formatted string pass it straight through.
+    if isinstance(value, str):
+        return value
+    # Same text as strftime(TIMESTAMP_FORMAT) for the naive local datetimes
+    # used here, without going through the C library's strftime.
+    return value.isoformat(" ", "seconds")
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    # Connections from init_db run in autocommit mode, so multi-statement
+    # writes open their transaction explicitly.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def init_db(db_path: str, background_writes: bool = False) -> BlinkConnection:
+    conn = sqlite3.connect(
+        db_path,
+        timeout=30.0,
+        factory=BlinkConnection,
+        cached_statements=256,
+        isolation_level=None,
+        check_same_thread=False,
+    )
     conn.execute("PRAGMA busy_timeout = 5000")
     conn.execute("PRAGMA journal_mode = WAL")
     conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -8000")
+    conn.execute("PRAGMA mmap_size = 268435456")
 
-    with conn:
+    with transaction(conn):
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS blink_events (
@@ -37,57 +224,127 @@ def init_db(db_path: str) -> sqlite3.Connection:
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_blink_aggregates_type_start ON blink_aggregates(interval_type, interval_start)"
         )
+    conn.execute("PRAGMA optimize")
+
+    # A second connection to ":memory:" would open a different database.
+    if background_writes and db_path != ":memory:":
+        conn.event_writer = BlinkEventWriter(conn, db_path)
 
     return conn
 
 
-def record_blink_event(conn: sqlite3.Connection, event_time: datetime) -> None:
-    with conn:
-        conn.execute(
-            "INSERT INTO blink_events (event_time) VALUES (?)",
-            (event_time.strftime("%Y-%m-%d %H:%M:%S"),),
+def record_blink_event(conn: BlinkConnection, event_time: datetime | str) -> None:
+    # Events are buffered and written in batches so a blink does not pay for
+    # its own commit; readers flush first, so counts are never stale.
+    with conn.pending_lock:
+        conn.pending_events.append((format_timestamp(event_time),))
+        flush_due = (
+            len(conn.pending_events) >= BLINK_EVENT_FLUSH_SIZE
+            or time.monotonic() - conn.last_flush >= BLINK_EVENT_FLUSH_SECONDS
         )
+    if flush_due:
+        if conn.event_writer is not None:
+            conn.event_writer.wake.set()
+        else:
+            flush_blink_events(conn)
+
+
+def _take_pending_events(conn: BlinkConnection) -> list[tuple[str]]:
+    with conn.pending_lock:
+        pending = conn.pending_events
+        conn.pending_events = []
+        conn.last_flush = time.monotonic()
+    return pending
 
 
-def count_blinks_in_range(conn: sqlite3.Connection, start: datetime, end: datetime) -> int:
+def flush_blink_events(conn: BlinkConnection, force: bool = True) -> None:
+    if conn.event_writer is not None:
+        # The writer thread handles periodic flushes; only readers that need
+        # up-to-date counts force one.
+        if force:
+            conn.event_writer.flush()
+        return
+
+    with conn.pending_lock:
+        if not force and time.monotonic() - conn.last_flush < BLINK_EVENT_FLUSH_SECONDS:
+            return
+    pending = _take_pending_events(conn)
+    if not pending:
+        return
+    with transaction(conn):
+        conn.executemany(INSERT_BLINK_EVENT_SQL, pending)
+
+
+def count_blinks_in_range(conn: BlinkConnection, start: datetime, end: datetime) -> int:
+    flush_blink_events(conn)
     cursor = conn.execute(
-        "SELECT COUNT(*) FROM blink_events WHERE event_time >= ? AND event_time <= ?",
+        COUNT_BLINKS_SQL,
         (
-            start.strftime("%Y-%m-%d %H:%M:%S"),
-            end.strftime("%Y-%m-%d %H:%M:%S"),
+            format_timestamp(start),
+            format_timestamp(end + timedelta(seconds=1)),
         ),
     )
     row = cursor.fetchone()
     return int(row[0]) if row else 0
 
 
+def fetch_blink_times(conn: BlinkConnection, start: datetime | str) -> list[datetime]:
+    flush_blink_events(conn)
+    cursor = conn.execute(FETCH_BLINK_TIMES_SQL, (format_timestamp(start),))
+    return [datetime.fromisoformat(event_time) for (event_time,) in cursor]
+
+
 def record_aggregate(
     conn: sqlite3.Connection,
     interval_type: str,
-    start: datetime,
-    end: datetime,
+    start: datetime | str,
+    end: datetime | str,
     blink_count: int,
 ) -> None:
-    with conn:
-        conn.execute(
-            """
-            INSERT INTO blink_aggregates (
-                interval_type,
-                interval_start,
-                interval_end,
-                blink_count
-            )
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(interval_type, interval_start)
-            DO UPDATE SET blink_count = excluded.blink_count, interval_end = excluded.interval_end
-            """,
-            (
-                interval_type,
-                start.strftime("%Y-%m-%d %H:%M:%S"),
-                end.strftime("%Y-%m-%d %H:%M:%S"),
-                blink_count,
-            ),
-        )
+    # A single statement commits on its own in autocommit mode.
+    conn.execute(
+        UPSERT_AGGREGATE_SQL,
+        (
+            interval_type,
+            format_timestamp(start),
+            format_timestamp(end),
+            blink_count,
+        ),
+    )
+
+
+def fill_minute_rollups(
+    conn: BlinkConnection,
+    start: datetime | str,
+    end: datetime | str,
+) -> int:
+    """Upsert minute rollups for blinks in [start, end); returns rows written."""
+    flush_blink_events(conn)
+    cursor = conn.execute(
+        FILL_MINUTE_ROLLUPS_SQL,
+        (format_timestamp(start), format_timestamp(end)),
+    )
+    return cursor.rowcount
+
+
+def count_blinks_from_aggregate(
+    conn: BlinkConnection,
+    interval_type: str,
+    start: datetime | str,
+    end: datetime | str,
+) -> int | None:
+    cursor = conn.execute(
+        SUM_AGGREGATES_SQL,
+        (
+            interval_type,
+            format_timestamp(start),
+            format_timestamp(end),
+        ),
+    )
+    row_count, blink_count = cursor.fetchone()
+    if row_count == 0:
+        return None
+    return int(blink_count)
 
 
 def fetch_recent_aggregates(
@@ -99,15 +356,6 @@ def fetch_recent_aggregates(
     if safe_limit == 0:
         return []
 
-    cursor = conn.execute(
-        """
-        SELECT interval_start, blink_count
-        FROM blink_aggregates
-        WHERE interval_type = ?
-        ORDER BY interval_start DESC
-        LIMIT ?
-        """,
-        (interval_type, safe_limit),
-    )
+    cursor = conn.execute(FETCH_RECENT_AGGREGATES_SQL, (interval_type, safe_limit))
     rows = cursor.fetchall()
     return [(str(interval_start), int(blink_count)) for interval_start, blink_count in rows]
@@ -1,10 +1,22 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from collections.abc import Iterable
 
+# Handlers do their file and console I/O on listener threads; the loggers
+# only enqueue records, so a slow disk never stalls the frame loop.
+_listeners: dict[str, logging.handlers.QueueListener] = {}
+
 
 def setup_logging(output_dir: str) -> tuple[logging.Logger, logging.Logger, logging.Logger]:
+    # The format below never prints thread or process details, so skip
+    # collecting them for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
 
     app_handler = logging.handlers.RotatingFileHandler(
@@ -51,16 +63,42 @@ def _configure_logger(name: str, handlers: Iterable[logging.Handler]) -> logging
     logger.setLevel(logging.INFO)
     logger.propagate = False
 
+    _stop_listener(name)
     for existing_handler in list(logger.handlers):
         logger.removeHandler(existing_handler)
         existing_handler.close()
 
-    for handler in handlers:
-        logger.addHandler(handler)
+    record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        record_queue,
+        *handlers,
+        respect_handler_level=True,
+    )
+    listener.start()
+    _listeners[name] = listener
+    logger.addHandler(logging.handlers.QueueHandler(record_queue))
 
     return logger
 
 
+def _stop_listener(name: str) -> None:
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+    # stop() drains records that are still queued before returning.
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def stop_logging() -> None:
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(stop_logging)
+
+
 def _build_console_handler(formatter: logging.Formatter) -> logging.StreamHandler:
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
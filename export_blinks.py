@@ -2,6 +2,7 @@ import argparse
 import csv
 import json
 import os
+import pathlib
 import sqlite3
 import sys
 from typing import Iterable
@@ -38,22 +39,20 @@ def export_rows_to_csv(path: str, headers: Iterable[str], rows: Iterable[tuple])
     with open(path, "w", newline="", encoding="utf-8") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(headers)
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
 def export_rows_to_json(path: str, headers: Iterable[str], rows: Iterable[tuple]) -> None:
     headers_tuple = tuple(headers)
     with open(path, "w", encoding="utf-8") as jsonfile:
         jsonfile.write("[\n")
-        is_first = True
+        # json.dumps takes the C encoder's one-shot path; json.dump would
+        # stream each object to the file in many small chunks.
+        separator = "  "
         for row in rows:
-            if is_first:
-                is_first = False
-            else:
-                jsonfile.write(",\n")
-            jsonfile.write("  ")
-            json.dump(dict(zip(headers_tuple, row)), jsonfile)
+            jsonfile.write(separator)
+            jsonfile.write(json.dumps(dict(zip(headers_tuple, row))))
+            separator = ",\n  "
         jsonfile.write("\n]\n")
 
 
@@ -80,8 +79,12 @@ def main(argv: list[str] | None = None) -> int:
     if not os.path.exists(db_path):
         raise FileNotFoundError(f"Database file not found: {db_path}")
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    # Read-only: the export never contends for the write lock held by a
+    # running tracker, and WAL lets it read alongside the live writer.
+    db_uri = f"{pathlib.Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(db_uri, timeout=30.0, uri=True)
     try:
+        conn.execute("PRAGMA mmap_size = 268435456")
         tables = {
             "events": "blink_events",
             "aggregates": "blink_aggregates",
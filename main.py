@@ -1,3 +1,4 @@
+import collections
 import cv2
 import logging
 import os
@@ -14,9 +15,26 @@ import mediapipe as mp
 import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from blink_app.domain.aggregates import AggregateState, update_aggregates
+from blink_app.domain.aggregates import (
+    AggregateSettings,
+    AggregateState,
+    close_csv_writers,
+    update_aggregates,
+)
 from blink_app.cli import parse_args
-from blink_app.constants import ALERT_NO_BLINK_SECONDS, LEFT_EYE, RIGHT_EYE
+from blink_app.constants import (
+    ALERT_NO_BLINK_SECONDS,
+    EYE_LANDMARKS,
+    FACE_DETECTION_CONFIDENCE,
+    FACE_TRACKING_CONFIDENCE,
+    EYE_PATCH_SIZE,
+    LEFT_EYE_POINTS,
+    MINUTE_TABLE_PAGE_SIZE,
+    MOTION_FORCE_FRAMES,
+    NO_FACE_BACKOFF_FRAMES,
+    NO_FACE_INFER_INTERVAL,
+    RIGHT_EYE_POINTS,
+)
 from blink_app.services.db import fetch_recent_aggregates, init_db
 from blink_app.domain.detection import BlinkState, eye_aspect_ratio
 from blink_app.services.logging_utils import setup_logging
@@ -28,9 +46,226 @@ class CameraResult(TypedDict):
     backend: str | None
     open_seconds: float | None
     first_frame_seconds: float | None
+    buffer_size_set: bool | None
+    fourcc: str | None
+
+
+class FrameGrabber:
+    """Reads camera frames on a daemon thread and keeps only the newest one.
+
+    cap.read() blocks for up to a frame interval; running it here keeps
+    that wait off the Qt thread, and frames that arrive while the previous
+    one is still being processed replace it instead of queueing up.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        self._cap = cap
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._frame: np.ndarray | None = None
+        self._preview: np.ndarray | None = None
+        self._failed = False
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="frame-grabber", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def latest(self) -> tuple[np.ndarray | None, bool]:
+        """Return the newest frame not yet previewed (or None) and whether capture failed."""
+        with self._lock:
+            frame = self._preview
+            self._preview = None
+            return frame, self._failed
+
+    def wait_latest(self, timeout: float) -> tuple[np.ndarray | None, bool]:
+        """Wait for the newest frame not yet analyzed; independent of latest()."""
+        if not self._frame_ready.wait(timeout):
+            return None, self._failed
+        with self._lock:
+            frame = self._frame
+            self._frame = None
+            self._frame_ready.clear()
+            return frame, self._failed
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        self._stopping = True
+        if self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            ret, frame = self._cap.read()
+            if not ret:
+                with self._lock:
+                    self._failed = True
+                    self._frame_ready.set()
+                return
+            with self._lock:
+                self._frame = frame
+                self._preview = frame
+                self._frame_ready.set()
+
+
+class FaceMeshWorker:
+    """Runs FaceMesh on a daemon thread and queues the resulting EAR readings.
+
+    Inference is the slowest step per frame; keeping it off the Qt thread
+    lets the preview and stats repaint at the camera rate. Readings are
+    queued rather than overwritten so the consecutive-frame blink rule
+    sees every analyzed frame.
+    """
+
+    def __init__(
+        self,
+        grabber: FrameGrabber,
+        face_mesh: mp.solutions.face_mesh.FaceMesh,
+        infer_interval: float,
+        infer_width: int,
+        motion_threshold: float,
+        logger: logging.Logger,
+    ) -> None:
+        self._grabber = grabber
+        self._face_mesh = face_mesh
+        self._infer_interval = infer_interval
+        self._infer_width = infer_width
+        self._motion_threshold = motion_threshold
+        self._logger = logger
+        self._rgb_buffer: np.ndarray | None = None
+        self._last_infer_time = 0.0
+        self._no_face_streak = 0
+        # Eye-region motion gate: the box around the last detected eyes, the
+        # grayscale patch taken there on the last analyzed frame, and the
+        # EAR values that frame produced.
+        self._eye_box: tuple[int, int, int, int] | None = None
+        self._eye_patch: np.ndarray | None = None
+        self._last_ears: list[float] = []
+        self._reused_frames = 0
+        self._readings: collections.deque[tuple[float, list[float]]] = collections.deque()
+        self.failed = False
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="face-mesh", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def readings(self) -> list[tuple[float, list[float]]]:
+        """Return and clear queued (timestamp, per-face EAR) readings, oldest first."""
+        readings = []
+        while self._readings:
+            readings.append(self._readings.popleft())
+        return readings
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        self._stopping = True
+        if self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            frame, capture_failed = self._grabber.wait_latest(timeout=0.1)
+            if frame is None:
+                if capture_failed:
+                    return
+                continue
+
+            infer_interval = self._infer_interval
+            if self._no_face_streak >= NO_FACE_BACKOFF_FRAMES:
+                infer_interval = max(infer_interval, NO_FACE_INFER_INTERVAL)
+            if infer_interval:
+                infer_time = time.monotonic()
+                if infer_time - self._last_infer_time < infer_interval:
+                    continue
+                self._last_infer_time = infer_time
+
+            if self._eyes_unchanged(frame):
+                self._reused_frames += 1
+                ears = self._last_ears
+            else:
+                try:
+                    ears = self._analyze(frame)
+                except Exception:
+                    if not self._stopping:
+                        self._logger.exception("FaceMesh processing failed.")
+                        self.failed = True
+                    return
+                self._reused_frames = 0
+                self._last_ears = ears
+                self._eye_patch = self._take_eye_patch(frame)
+            self._no_face_streak = 0 if ears else self._no_face_streak + 1
+            self._readings.append((time.time(), ears))
+
+    def _analyze(self, frame: np.ndarray) -> list[float]:
+        h, w = frame.shape[:2]
+        infer_frame = frame
+        infer_width = self._infer_width
+        if w > infer_width:
+            infer_frame = cv2.resize(
+                frame,
+                (infer_width, round(h * infer_width / w)),
+                interpolation=cv2.INTER_AREA,
+            )
+        if self._rgb_buffer is None or self._rgb_buffer.shape != infer_frame.shape:
+            self._rgb_buffer = np.empty_like(infer_frame)
+        self._rgb_buffer.flags.writeable = True
+        rgb = cv2.cvtColor(infer_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        # MediaPipe wraps a read-only array by reference instead of copying it,
+        # and process() waits for the graph to go idle before returning, so
+        # the buffer is no longer in use when the next frame overwrites it.
+        rgb.flags.writeable = False
+        results = self._face_mesh.process(rgb)
+
+        ears = []
+        eye_box = None
+        for face_landmarks in results.multi_face_landmarks or ():
+            landmarks = face_landmarks.landmark
+            eye_points = [(landmarks[i].x * w, landmarks[i].y * h) for i in EYE_LANDMARKS]
+            left_ear = eye_aspect_ratio(eye_points, LEFT_EYE_POINTS)
+            right_ear = eye_aspect_ratio(eye_points, RIGHT_EYE_POINTS)
+            ears.append((left_ear + right_ear) / 2.0)
+            if eye_box is None:
+                eye_box = self._eye_box_around(eye_points, w, h)
+        self._eye_box = eye_box
+        return ears
+
+    @staticmethod
+    def _eye_box_around(
+        eye_points: list[tuple[float, float]], w: int, h: int
+    ) -> tuple[int, int, int, int] | None:
+        xs = [x for x, _ in eye_points]
+        ys = [y for _, y in eye_points]
+        # Pad by a quarter of the eye span so lid movement stays inside the box.
+        pad = (max(xs) - min(xs)) * 0.25
+        x0, x1 = max(0, int(min(xs) - pad)), min(w, int(max(xs) + pad) + 1)
+        y0, y1 = max(0, int(min(ys) - pad)), min(h, int(max(ys) + pad) + 1)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1, y1
+
+    def _take_eye_patch(self, frame: np.ndarray) -> np.ndarray | None:
+        if not self._motion_threshold or self._eye_box is None:
+            return None
+        x0, y0, x1, y1 = self._eye_box
+        gray = cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
+        return cv2.resize(gray, EYE_PATCH_SIZE, interpolation=cv2.INTER_AREA)
+
+    def _eyes_unchanged(self, frame: np.ndarray) -> bool:
+        """Whether the eye region matches the last analyzed frame closely enough to reuse it."""
+        if self._eye_patch is None or self._reused_frames >= MOTION_FORCE_FRAMES:
+            return False
+        patch = self._take_eye_patch(frame)
+        if patch is None:
+            return False
+        return float(cv2.absdiff(patch, self._eye_patch).mean()) < self._motion_threshold
 
 
 class ToggleSwitch(QtWidgets.QCheckBox):
+    # Rendered track+knob per (checked, enabled, width, height, device pixel
+    # ratio); repaints only blit one of these.
+    _pixmap_cache: dict[tuple[bool, bool, int, int, float], QtGui.QPixmap] = {}
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
@@ -43,11 +278,28 @@ class ToggleSwitch(QtWidgets.QCheckBox):
         return QtCore.QSize(52, 28)
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
-        track_rect = QtCore.QRectF(1, 1, self.width() - 2, self.height() - 2)
+        dpr = self.devicePixelRatioF()
+        key = (self.isChecked(), self.isEnabled(), self.width(), self.height(), dpr)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._pixmap_cache[key] = self._render_pixmap(*key)
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+
+    @staticmethod
+    def _render_pixmap(
+        checked: bool, enabled: bool, width: int, height: int, dpr: float
+    ) -> QtGui.QPixmap:
+        pixmap = QtGui.QPixmap(round(width * dpr), round(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+
+        track_rect = QtCore.QRectF(1, 1, width - 2, height - 2)
         track_radius = track_rect.height() / 2
         knob_diameter = track_rect.height() - 6
         knob_y = track_rect.top() + 3
-        if self.isChecked():
+        if checked:
             knob_x = track_rect.right() - knob_diameter - 3
             track_color = QtGui.QColor("#4aa3ff")
             border_color = QtGui.QColor("#3f8fe0")
@@ -56,11 +308,11 @@ class ToggleSwitch(QtWidgets.QCheckBox):
             track_color = QtGui.QColor("#2b3142")
             border_color = QtGui.QColor("#3a4257")
 
-        if not self.isEnabled():
+        if not enabled:
             track_color = QtGui.QColor("#1d2332")
             border_color = QtGui.QColor("#242c3f")
 
-        painter = QtGui.QPainter(self)
+        painter = QtGui.QPainter(pixmap)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
         painter.setPen(QtGui.QPen(border_color, 1))
         painter.setBrush(QtGui.QBrush(track_color))
@@ -72,6 +324,7 @@ class ToggleSwitch(QtWidgets.QCheckBox):
         painter.drawEllipse(knob_rect)
 
         painter.end()
+        return pixmap
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
         if event.button() == QtCore.Qt.MouseButton.LeftButton:
@@ -100,8 +353,15 @@ class BlinkWindow(QtWidgets.QMainWindow):
         self._db_conn = db_conn
 
         self._cap: cv2.VideoCapture | None = None
+        self._grabber: FrameGrabber | None = None
+        self._face_worker: FaceMeshWorker | None = None
+        self._infer_interval = 1.0 / args.infer_fps if args.infer_fps else 0.0
+        self._ear_threshold = args.ear_threshold
+        self._ear_consec_frames = args.ear_consec_frames
+        self._display_enabled = not args.no_display
         self._face_mesh: mp.solutions.face_mesh.FaceMesh | None = None
         self._frame_timer: QtCore.QTimer | None = None
+        self._stats_timer: QtCore.QTimer | None = None
         self._init_timer: QtCore.QTimer | None = None
         self._closing = False
 
@@ -112,15 +372,23 @@ class BlinkWindow(QtWidgets.QMainWindow):
             "backend": None,
             "open_seconds": None,
             "first_frame_seconds": None,
+            "buffer_size_set": None,
+            "fourcc": None,
         }
 
         self._blink_state = BlinkState(last_blink_time=time.time())
-        self._aggregate_state = AggregateState(last_stats_time=time.time())
+        self._aggregate_state = AggregateState(
+            last_stats_time=time.time(),
+            settings=AggregateSettings.from_args(args, output_dir),
+        )
         self._alerts_enabled = bool(getattr(args, "enable_alerts", False))
         self._alert_after_input: QtWidgets.QDoubleSpinBox | None = None
         self._minute_table: QtWidgets.QTableWidget | None = None
         self._last_minute_table_refresh: datetime | None = None
-        self._minute_table_limit = 360
+        self._minute_table_limit = MINUTE_TABLE_PAGE_SIZE
+        self._minute_rows: list[tuple[str, int]] = []
+        # Texts currently shown on the stat cards, in _update_stats_panel order.
+        self._last_stats = ("0", "--", "0", "0", "0")
 
         self.setWindowTitle("Blink Tracker")
         self._video_label = QtWidgets.QLabel(alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -136,13 +404,15 @@ class BlinkWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(central_widget)
         self._apply_theme()
 
-        self._waiting_frame = self._build_waiting_frame()
+        self._waiting_pixmap = self._frame_to_pixmap(self._build_waiting_frame())
+        self._waiting_label_size: QtCore.QSize | None = None
         self._camera_thread = threading.Thread(target=self._open_camera, daemon=True)
         self._camera_thread.start()
 
         self._init_timer = QtCore.QTimer(self)
         self._init_timer.timeout.connect(self._update_initializing_frame)
-        self._init_timer.start(50)
+        # Only the label size can change what the waiting image looks like.
+        self._init_timer.start(200)
 
     def _apply_theme(self) -> None:
         self.setStyleSheet(
@@ -384,6 +654,8 @@ class BlinkWindow(QtWidgets.QMainWindow):
             QtWidgets.QHeaderView.ResizeMode.ResizeToContents,
         )
 
+        table.verticalScrollBar().valueChanged.connect(self._load_more_minutes_if_needed)
+
         self._minute_table = table
         panel_layout.addWidget(table, stretch=1)
         self._refresh_minute_table()
@@ -473,10 +745,18 @@ class BlinkWindow(QtWidgets.QMainWindow):
     def _toggle_alerts(self, enabled: bool) -> None:
         self._alerts_enabled = enabled
         self._args.enable_alerts = enabled
+        self._refresh_aggregate_settings()
         self._refresh_alert_status()
 
     def _update_alert_after_seconds(self, value: float) -> None:
         self._args.alert_after_seconds = float(value)
+        self._refresh_aggregate_settings()
+
+    def _refresh_aggregate_settings(self) -> None:
+        self._aggregate_state.settings = AggregateSettings.from_args(
+            self._args,
+            self._output_dir,
+        )
 
     def _refresh_alert_status(self) -> None:
         if self._alerts_enabled:
@@ -517,17 +797,26 @@ class BlinkWindow(QtWidgets.QMainWindow):
     def _open_camera(self) -> None:
         try:
             backends: list[tuple[str, int | None]] = []
-            if hasattr(cv2, "CAP_DSHOW"):
-                backends.append(("DSHOW", cv2.CAP_DSHOW))
-            backends.append(("DEFAULT", None))
+            if self._args.capture_backend == "gstreamer":
+                backends.append(("GSTREAMER", cv2.CAP_GSTREAMER))
+            else:
+                if sys.platform.startswith("linux") and hasattr(cv2, "CAP_V4L2"):
+                    # V4L2 honors CAP_PROP_BUFFERSIZE; other Linux backends may not.
+                    backends.append(("V4L2", cv2.CAP_V4L2))
+                if hasattr(cv2, "CAP_DSHOW"):
+                    backends.append(("DSHOW", cv2.CAP_DSHOW))
+                backends.append(("DEFAULT", None))
 
             last_error: str | None = None
             for backend_name, backend_id in backends:
+                source: int | str = self._args.camera_index
+                if backend_name == "GSTREAMER":
+                    source = gstreamer_pipeline(self._args.camera_index)
                 open_start = time.perf_counter()
                 local_cap = (
-                    cv2.VideoCapture(self._args.camera_index, backend_id)
+                    cv2.VideoCapture(source, backend_id)
                     if backend_id is not None
-                    else cv2.VideoCapture(self._args.camera_index)
+                    else cv2.VideoCapture(source)
                 )
                 open_seconds = time.perf_counter() - open_start
 
@@ -536,6 +825,12 @@ class BlinkWindow(QtWidgets.QMainWindow):
                     local_cap.release()
                     continue
 
+                if backend_name == "GSTREAMER":
+                    # The pipeline's appsink already keeps only the newest frame.
+                    buffer_size_set = True
+                else:
+                    # Keep at most one queued frame so reads never return stale images.
+                    buffer_size_set = local_cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                 if self._args.fps is not None:
                     local_cap.set(cv2.CAP_PROP_FPS, self._args.fps)
 
@@ -561,6 +856,8 @@ class BlinkWindow(QtWidgets.QMainWindow):
                 self._camera_result["backend"] = backend_name
                 self._camera_result["open_seconds"] = open_seconds
                 self._camera_result["first_frame_seconds"] = first_frame_seconds
+                self._camera_result["buffer_size_set"] = buffer_size_set
+                self._camera_result["fourcc"] = capture_fourcc(local_cap)
                 return
 
             self._camera_result["error"] = (
@@ -576,7 +873,10 @@ class BlinkWindow(QtWidgets.QMainWindow):
         if self._closing:
             return
         if not self._camera_ready.is_set():
-            self._show_frame(self._waiting_frame)
+            label_size = self._video_label.size()
+            if label_size != self._waiting_label_size:
+                self._waiting_label_size = label_size
+                self._show_pixmap(self._waiting_pixmap)
             return
 
         if self._init_timer is not None:
@@ -596,94 +896,132 @@ class BlinkWindow(QtWidgets.QMainWindow):
 
         if self._camera_result["backend"] is not None:
             self._app_logger.info(
-                "Camera initialized (backend=%s, open=%.2fs, first_frame=%.2fs).",
+                "Camera initialized (backend=%s, fourcc=%s, open=%.2fs, first_frame=%.2fs).",
                 self._camera_result["backend"],
+                self._camera_result["fourcc"] or "unknown",
                 self._camera_result["open_seconds"] or 0.0,
                 self._camera_result["first_frame_seconds"] or 0.0,
             )
+        if self._camera_result["buffer_size_set"] is False:
+            self._app_logger.warning(
+                "Camera backend ignored CAP_PROP_BUFFERSIZE=1; frames may lag behind. "
+                "If they do, try --capture-backend gstreamer."
+            )
 
         face_mesh_start = time.perf_counter()
         mp_face_mesh = mp.solutions.face_mesh
         self._face_mesh = mp_face_mesh.FaceMesh(
             static_image_mode=False,
             max_num_faces=1,
-            refine_landmarks=True,
+            # Iris refinement adds a second model pass per frame; the EAR
+            # landmarks are all part of the base 468-point mesh.
+            refine_landmarks=self._args.refine_landmarks,
+            min_detection_confidence=FACE_DETECTION_CONFIDENCE,
+            min_tracking_confidence=FACE_TRACKING_CONFIDENCE,
         )
         self._app_logger.info(
             "FaceMesh initialized in %.2fs.",
             time.perf_counter() - face_mesh_start,
         )
+        self._grabber = FrameGrabber(self._cap)
+        self._face_worker = FaceMeshWorker(
+            self._grabber,
+            self._face_mesh,
+            self._infer_interval,
+            self._args.infer_width,
+            self._args.motion_threshold,
+            self._app_logger,
+        )
+        self._grabber.start()
+        self._face_worker.start()
+        if not self._display_enabled:
+            self._video_label.clear()
+            self._video_label.setText("Camera preview disabled (--no-display).")
         self._app_logger.info("Camera started. Press Esc or close window to exit.")
 
         self._frame_timer = QtCore.QTimer(self)
         self._frame_timer.timeout.connect(self._update_frame)
         self._frame_timer.start(30)
 
+        # The stat cards only change about once a second; repainting their
+        # text at the frame rate is wasted layout work.
+        self._stats_timer = QtCore.QTimer(self)
+        self._stats_timer.timeout.connect(self._update_stats_panel)
+        self._stats_timer.start(500)
+
     def _update_frame(self) -> None:
         if self._closing:
             return
-        if self._cap is None or self._face_mesh is None:
+        if self._grabber is None or self._face_worker is None:
             return
-        ret, frame = self._cap.read()
-        if not ret:
-            self._app_logger.warning("Failed to read frame.")
+        if self._face_worker.failed:
             self.close()
             return
-
-        h, w = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        try:
-            results = self._face_mesh.process(rgb)
-        except Exception:
-            if self._closing:
-                return
-            self._app_logger.exception("FaceMesh processing failed.")
-            self.close()
+        frame, capture_failed = self._grabber.latest()
+        readings = self._face_worker.readings()
+        if frame is None and not readings:
+            if capture_failed:
+                self._app_logger.warning("Failed to read frame.")
+                self.close()
             return
-        now_dt = datetime.now()
-        now_ts = time.time()
-
-        if results.multi_face_landmarks:
-            for face_landmarks in results.multi_face_landmarks:
-                landmarks = [(lm.x * w, lm.y * h) for lm in face_landmarks.landmark]
 
-                left_ear = eye_aspect_ratio(landmarks, LEFT_EYE)
-                right_ear = eye_aspect_ratio(landmarks, RIGHT_EYE)
-                ear = (left_ear + right_ear) / 2.0
-
-                self._blink_state.update(
+        blink_state = self._blink_state
+        for reading_ts, ears in readings:
+            if not ears:
+                continue
+            reading_dt = datetime.fromtimestamp(reading_ts)
+            for ear in ears:
+                blink_state.update(
                     ear,
-                    now_dt,
-                    now_ts,
-                    self._args.ear_threshold,
-                    self._args.ear_consec_frames,
+                    reading_dt,
+                    reading_ts,
+                    self._ear_threshold,
+                    self._ear_consec_frames,
                     self._blink_logger,
                     self._db_conn,
                 )
 
+        # One clock read keeps the timestamp and the datetime in agreement.
+        now_ts = time.time()
+        now_dt = datetime.fromtimestamp(now_ts)
         update_aggregates(
             self._args,
             self._aggregate_state,
             now_dt,
             now_ts,
-            self._blink_state,
+            blink_state,
             self._db_conn,
             self._aggregate_logger,
             self._output_dir,
         )
 
-        self._update_stats_panel(now_ts)
+        # Detection and alerts keep running while minimized; only the
+        # widgets nobody can see are left alone.
+        if self.isMinimized():
+            return
         self._refresh_minute_table_if_needed()
-        self._show_frame(frame)
-
-    def _update_stats_panel(self, now_ts: float) -> None:
-        self._session_blinks_value.setText(str(self._blink_state.blink_counter))
-        self._last_blink_value.setText(
-            self._format_last_blink(self._blink_state.last_blink_time, now_ts)
+        if frame is not None and self._display_enabled:
+            self._show_frame(frame)
+
+    def _update_stats_panel(self) -> None:
+        stats = (
+            str(self._blink_state.blink_counter),
+            self._format_last_blink(self._blink_state.last_blink_time, time.time()),
+            str(self._aggregate_state.blinks_1m),
+            str(self._aggregate_state.blinks_1h),
+            str(self._aggregate_state.blinks_day),
         )
-        self._blinks_per_minute_value.setText(str(self._aggregate_state.blinks_1m))
-        self._blinks_per_hour_value.setText(str(self._aggregate_state.blinks_1h))
-        self._blinks_today_value.setText(str(self._aggregate_state.blinks_day))
+        labels = (
+            self._session_blinks_value,
+            self._last_blink_value,
+            self._blinks_per_minute_value,
+            self._blinks_per_hour_value,
+            self._blinks_today_value,
+        )
+        for label, text, last_text in zip(labels, stats, self._last_stats):
+            if text != last_text:
+                label.setText(text)
+        self._last_stats = stats
 
     def _refresh_minute_table_if_needed(self) -> None:
         if self._minute_table is None:
@@ -701,6 +1039,15 @@ class BlinkWindow(QtWidgets.QMainWindow):
         self._refresh_minute_table()
         self._last_minute_table_refresh = last_logged_minute
 
+    def _load_more_minutes_if_needed(self, value: int) -> None:
+        if value < self._minute_table.verticalScrollBar().maximum():
+            return
+        # A short page means the table already holds every stored minute.
+        if len(self._minute_rows) < self._minute_table_limit:
+            return
+        self._minute_table_limit += MINUTE_TABLE_PAGE_SIZE
+        self._refresh_minute_table()
+
     def _refresh_minute_table(self) -> None:
         if self._minute_table is None:
             return
@@ -710,39 +1057,88 @@ class BlinkWindow(QtWidgets.QMainWindow):
             interval_type="minute",
             limit=self._minute_table_limit,
         )
-        self._minute_table.setRowCount(len(rows))
+        old_rows = self._minute_rows
+        if rows == old_rows:
+            return
+
+        # New minutes arrive at the top; shift the existing rows down instead
+        # of rebuilding every item, then touch only rows whose values differ.
+        table = self._minute_table
+        new_top_rows = len(rows)
+        if old_rows:
+            newest_shown = old_rows[0][0]
+            for row_index, (interval_start, _) in enumerate(rows):
+                if interval_start == newest_shown:
+                    new_top_rows = row_index
+                    break
+        for _ in range(new_top_rows):
+            table.insertRow(0)
+        table.setRowCount(len(rows))
+
         for row_index, (interval_start, blink_count) in enumerate(rows):
-            time_item = QtWidgets.QTableWidgetItem(interval_start)
+            old_index = row_index - new_top_rows
+            if 0 <= old_index < len(old_rows) and old_rows[old_index] == (
+                interval_start,
+                blink_count,
+            ):
+                continue
+            self._set_minute_row(row_index, interval_start, blink_count)
+        table.resizeRowsToContents()
+        self._minute_rows = rows
+
+    def _set_minute_row(self, row_index: int, interval_start: str, blink_count: int) -> None:
+        time_item = self._minute_table.item(row_index, 0)
+        if time_item is None:
+            time_item = QtWidgets.QTableWidgetItem()
             time_item.setTextAlignment(
                 QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
             )
-            count_item = QtWidgets.QTableWidgetItem(str(blink_count))
+            self._minute_table.setItem(row_index, 0, time_item)
+        time_item.setText(interval_start)
+
+        count_item = self._minute_table.item(row_index, 1)
+        if count_item is None:
+            count_item = QtWidgets.QTableWidgetItem()
             count_item.setTextAlignment(
                 QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
             )
-            self._minute_table.setItem(row_index, 0, time_item)
             self._minute_table.setItem(row_index, 1, count_item)
-        self._minute_table.resizeRowsToContents()
+        count_item.setText(str(blink_count))
 
     def _show_frame(self, frame: np.ndarray) -> None:
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        height, width = rgb.shape[:2]
-        bytes_per_line = 3 * width
+        self._show_pixmap(self._frame_to_pixmap(frame))
+
+    @staticmethod
+    def _frame_to_pixmap(frame: np.ndarray) -> QtGui.QPixmap:
+        height, width = frame.shape[:2]
+        # Qt reads OpenCV's BGR layout directly; fromImage copies the pixels,
+        # so the frame does not need to outlive this call.
         image = QtGui.QImage(
-            rgb.data,
+            frame.data,
             width,
             height,
-            bytes_per_line,
-            QtGui.QImage.Format.Format_RGB888,
+            frame.strides[0],
+            QtGui.QImage.Format.Format_BGR888,
         )
-        pixmap = QtGui.QPixmap.fromImage(image.copy())
+        return QtGui.QPixmap.fromImage(image)
+
+    def _show_pixmap(self, pixmap: QtGui.QPixmap) -> None:
         scaled = pixmap.scaled(
             self._video_label.size(),
             QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
+            QtCore.Qt.TransformationMode.FastTransformation,
         )
         self._video_label.setPixmap(scaled)
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.WindowStateChange and self._stats_timer is not None:
+            if self.isMinimized():
+                self._stats_timer.stop()
+            elif not self._closing and not self._stats_timer.isActive():
+                self._update_stats_panel()
+                self._stats_timer.start()
+        super().changeEvent(event)
+
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
         if event.key() == QtCore.Qt.Key.Key_Escape:
             self.close()
@@ -755,19 +1151,55 @@ class BlinkWindow(QtWidgets.QMainWindow):
             self._init_timer.stop()
         if self._frame_timer is not None:
             self._frame_timer.stop()
+        if self._stats_timer is not None:
+            self._stats_timer.stop()
         if self._camera_thread.is_alive():
             self._camera_thread.join(timeout=10.0)
             if self._camera_thread.is_alive():
                 self._app_logger.warning("Camera initialization thread did not stop cleanly.")
-        if self._face_mesh is not None:
+        # A thread that outlives its join may still be inside process() or
+        # read(); leave its resource open rather than close it under a live
+        # call. Both threads are daemons and end with the process.
+        worker_stopped = self._face_worker is None or self._face_worker.stop()
+        if not worker_stopped:
+            self._app_logger.warning(
+                "FaceMesh worker thread did not stop cleanly; leaving FaceMesh open."
+            )
+        grabber_stopped = self._grabber is None or self._grabber.stop()
+        if not grabber_stopped:
+            self._app_logger.warning(
+                "Frame grabber thread did not stop cleanly; leaving the camera open."
+            )
+        if self._face_mesh is not None and worker_stopped:
             self._face_mesh.close()
-        if self._cap is not None:
+        if self._cap is not None and grabber_stopped:
             self._cap.release()
+        close_csv_writers()
         self._db_conn.close()
         self._app_logger.info("Camera and windows closed. Goodbye!")
         super().closeEvent(event)
 
 
+def capture_fourcc(cap: cv2.VideoCapture) -> str | None:
+    code = int(cap.get(cv2.CAP_PROP_FOURCC))
+    if code <= 0:
+        return None
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
+
+def gstreamer_pipeline(camera_index: int) -> str:
+    if sys.platform == "win32":
+        source = f"ksvideosrc device-index={camera_index}"
+    elif sys.platform == "darwin":
+        source = f"avfvideosrc device-index={camera_index}"
+    else:
+        source = f"v4l2src device=/dev/video{camera_index}"
+    return (
+        f"{source} ! videoconvert ! video/x-raw,format=BGR ! "
+        "appsink max-buffers=1 drop=true sync=false"
+    )
+
+
 def ensure_writable_directory(path: str) -> str:
     absolute_path = os.path.abspath(path)
     os.makedirs(absolute_path, exist_ok=True)
@@ -810,7 +1242,7 @@ def main() -> int:
     db_path = ""
     try:
         db_path = resolve_db_path(output_dir, args.db_path)
-        db_conn = init_db(db_path)
+        db_conn = init_db(db_path, background_writes=True)
     except (OSError, sqlite3.Error) as exc:
         app_logger.error("Could not initialize database '%s': %s", db_path or args.db_path, exc)
         return 1
@@ -6,8 +6,19 @@ import unittest
 from datetime import datetime
 from unittest.mock import patch
 
-from blink_app.domain.aggregates import AggregateState, update_aggregates
-from blink_app.services.db import init_db, record_blink_event
+from blink_app.domain.aggregates import (
+    AggregateSettings,
+    AggregateState,
+    close_csv_writers,
+    update_aggregates,
+    write_csv_row,
+)
+from blink_app.services.db import (
+    fetch_blink_times,
+    init_db,
+    record_aggregate,
+    record_blink_event,
+)
 from blink_app.domain.detection import BlinkState
 
 
@@ -16,6 +27,9 @@ class UpdateAggregatesTest(unittest.TestCase):
         self.logger = logging.getLogger("test.aggregates")
         self.logger.addHandler(logging.NullHandler())
 
+    def tearDown(self) -> None:
+        close_csv_writers()
+
     def test_update_aggregates_records_counts_and_csv(self) -> None:
         now_dt = datetime(2024, 1, 2, 12, 34, 56)
         now_ts = 1704198896.0
@@ -57,6 +71,7 @@ class UpdateAggregatesTest(unittest.TestCase):
                 aggregate_logger=self.logger,
                 output_dir=tmp_dir,
             )
+            close_csv_writers()
 
             self.assertEqual(state.blinks_1m, 2)
             self.assertEqual(state.blinks_10m, 2)
@@ -80,6 +95,99 @@ class UpdateAggregatesTest(unittest.TestCase):
                 rows = list(csv.reader(handle))
             self.assertEqual(rows[1], ["2024-01-02", "9"])
 
+    def test_write_csv_row_keeps_file_open_and_writes_header_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = f"{tmp_dir}/blinks.csv"
+            write_csv_row(path, ["date", "blinks"], ["2024-01-01", 1])
+            write_csv_row(path, ["date", "blinks"], ["2024-01-02", 2])
+            close_csv_writers()
+            write_csv_row(path, ["date", "blinks"], ["2024-01-03", 3])
+            close_csv_writers()
+
+            with open(path, newline="") as handle:
+                rows = list(csv.reader(handle))
+        self.assertEqual(
+            rows,
+            [
+                ["date", "blinks"],
+                ["2024-01-01", "1"],
+                ["2024-01-02", "2"],
+                ["2024-01-03", "3"],
+            ],
+        )
+
+    def test_update_aggregates_reuses_stored_previous_day_rollup(self) -> None:
+        now_ts = 1704198896.0
+        state = AggregateState(last_stats_time=now_ts - 2.0)
+        blink_state = BlinkState(last_blink_time=now_ts - 10.0)
+        args = argparse.Namespace(csv_output=False, enable_alerts=False)
+
+        db_conn = init_db(":memory:")
+        record_aggregate(
+            db_conn,
+            "day",
+            datetime(2024, 1, 1, 0, 0, 0),
+            datetime(2024, 1, 1, 23, 59, 59),
+            42,
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("blink_app.domain.aggregates.count_blinks_in_range") as count_mock:
+                update_aggregates(
+                    args=args,
+                    state=state,
+                    now_dt=datetime(2024, 1, 2, 12, 34, 56),
+                    now_ts=now_ts,
+                    blink_state=blink_state,
+                    db_conn=db_conn,
+                    aggregate_logger=self.logger,
+                    output_dir=tmp_dir,
+                )
+                count_mock.assert_not_called()
+
+        self.assertEqual(state.last_logged_day, datetime(2024, 1, 1))
+
+    def test_update_aggregates_counts_new_blinks_without_requerying(self) -> None:
+        now_ts = 1704198896.0
+        state = AggregateState(last_stats_time=now_ts - 2.0)
+        blink_state = BlinkState(last_blink_time=now_ts - 10.0)
+        args = argparse.Namespace(csv_output=False, enable_alerts=False)
+
+        db_conn = init_db(":memory:")
+        record_blink_event(db_conn, datetime(2024, 1, 2, 12, 34, 1))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch(
+                "blink_app.domain.aggregates.fetch_blink_times",
+                wraps=fetch_blink_times,
+            ) as fetch_mock:
+                update_aggregates(
+                    args=args,
+                    state=state,
+                    now_dt=datetime(2024, 1, 2, 12, 34, 56),
+                    now_ts=now_ts,
+                    blink_state=blink_state,
+                    db_conn=db_conn,
+                    aggregate_logger=self.logger,
+                    output_dir=tmp_dir,
+                )
+                blink_dt = datetime(2024, 1, 2, 12, 34, 58)
+                blink_state.update(0.1, blink_dt, now_ts + 1.0, 0.2, 1, self.logger, db_conn)
+                blink_state.update(0.3, blink_dt, now_ts + 2.0, 0.2, 1, self.logger, db_conn)
+                update_aggregates(
+                    args=args,
+                    state=state,
+                    now_dt=datetime(2024, 1, 2, 12, 35, 1),
+                    now_ts=now_ts + 5.0,
+                    blink_state=blink_state,
+                    db_conn=db_conn,
+                    aggregate_logger=self.logger,
+                    output_dir=tmp_dir,
+                )
+                fetch_mock.assert_called_once()
+
+        self.assertEqual(state.blinks_1m, 2)
+        self.assertEqual(state.blinks_day, 2)
+        self.assertEqual(len(blink_state.blink_times), 0)
+
     def test_update_aggregates_returns_early_when_called_too_soon(self) -> None:
         now_dt = datetime(2024, 1, 2, 12, 34, 56)
         now_ts = 1704198896.0
@@ -170,6 +278,134 @@ class UpdateAggregatesTest(unittest.TestCase):
 
         self.assertEqual(state.last_alert_time, now_ts - 0.5)
 
+    def test_alert_settings_treat_silent_sound_as_disabled(self) -> None:
+        args = argparse.Namespace(
+            csv_output=False,
+            enable_alerts=True,
+            alert_sound="None",
+            alert_sound_file=None,
+        )
+        self.assertFalse(AggregateSettings.from_args(args, "out").enable_alerts)
+
+        args.alert_sound_file = "alert.wav"
+        self.assertTrue(AggregateSettings.from_args(args, "out").enable_alerts)
+
+    def test_alert_settings_treat_empty_sound_as_disabled(self) -> None:
+        args = argparse.Namespace(
+            csv_output=False,
+            enable_alerts=True,
+            alert_sound="",
+            alert_sound_file=None,
+        )
+        self.assertFalse(AggregateSettings.from_args(args, "out").enable_alerts)
+
+        args.alert_sound_file = "alert.wav"
+        self.assertTrue(AggregateSettings.from_args(args, "out").enable_alerts)
+
+    def test_update_aggregates_skips_rollups_within_same_minute(self) -> None:
+        now_ts = 1704198896.0
+        state = AggregateState(last_stats_time=now_ts - 2.0)
+        blink_state = BlinkState(last_blink_time=now_ts - 10.0)
+        args = argparse.Namespace(csv_output=False, enable_alerts=False)
+
+        db_conn = init_db(":memory:")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            update_aggregates(
+                args=args,
+                state=state,
+                now_dt=datetime(2024, 1, 2, 12, 34, 50),
+                now_ts=now_ts,
+                blink_state=blink_state,
+                db_conn=db_conn,
+                aggregate_logger=self.logger,
+                output_dir=tmp_dir,
+            )
+            with patch("blink_app.domain.aggregates.record_aggregate") as record_mock:
+                update_aggregates(
+                    args=args,
+                    state=state,
+                    now_dt=datetime(2024, 1, 2, 12, 34, 55),
+                    now_ts=now_ts + 5.0,
+                    blink_state=blink_state,
+                    db_conn=db_conn,
+                    aggregate_logger=self.logger,
+                    output_dir=tmp_dir,
+                )
+                record_mock.assert_not_called()
+
+        self.assertEqual(state.last_stats_time, now_ts + 5.0)
+
+    def test_update_aggregates_backfills_single_skipped_minute(self) -> None:
+        now_ts = 1704196865.0
+        state = AggregateState(last_stats_time=now_ts - 2.0)
+        blink_state = BlinkState(last_blink_time=now_ts - 10.0)
+        args = argparse.Namespace(csv_output=False, enable_alerts=False)
+
+        db_conn = init_db(":memory:")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            update_aggregates(
+                args=args,
+                state=state,
+                now_dt=datetime(2024, 1, 2, 12, 1, 5),
+                now_ts=now_ts,
+                blink_state=blink_state,
+                db_conn=db_conn,
+                aggregate_logger=self.logger,
+                output_dir=tmp_dir,
+            )
+            blink_dt = datetime(2024, 1, 2, 12, 1, 30)
+            blink_state.update(0.1, blink_dt, now_ts + 25.0, 0.2, 1, self.logger, db_conn)
+            blink_state.update(0.3, blink_dt, now_ts + 25.5, 0.2, 1, self.logger, db_conn)
+            # No tick during 12:02, so the 12:01 minute is never logged directly.
+            update_aggregates(
+                args=args,
+                state=state,
+                now_dt=datetime(2024, 1, 2, 12, 3, 5),
+                now_ts=now_ts + 120.0,
+                blink_state=blink_state,
+                db_conn=db_conn,
+                aggregate_logger=self.logger,
+                output_dir=tmp_dir,
+            )
+
+        rows = db_conn.execute(
+            "SELECT interval_start, blink_count FROM blink_aggregates "
+            "WHERE interval_type = 'minute' ORDER BY interval_start"
+        ).fetchall()
+        self.assertIn(("2024-01-02 12:01:00", 1), rows)
+        self.assertEqual(state.last_logged_minute, datetime(2024, 1, 2, 12, 2))
+
+    def test_update_aggregates_resolves_settings_once(self) -> None:
+        now_ts = 1704198896.0
+        state = AggregateState(last_stats_time=now_ts - 2.0)
+        blink_state = BlinkState(last_blink_time=now_ts - 20.0)
+        args = argparse.Namespace(csv_output=False, enable_alerts=False)
+
+        db_conn = init_db(":memory:")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.object(
+                AggregateSettings,
+                "from_args",
+                wraps=AggregateSettings.from_args,
+            ) as from_args_mock:
+                for offset in range(3):
+                    update_aggregates(
+                        args=args,
+                        state=state,
+                        now_dt=datetime(2024, 1, 2, 12, 34, 56 + offset),
+                        now_ts=now_ts + 2.0 * offset,
+                        blink_state=blink_state,
+                        db_conn=db_conn,
+                        aggregate_logger=self.logger,
+                        output_dir=tmp_dir,
+                    )
+
+            from_args_mock.assert_called_once()
+            self.assertEqual(
+                state.settings.minute_csv_path,
+                f"{tmp_dir}/blinks_per_minute.csv",
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,254 @@
+import os
+import subprocess
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from blink_app.services import alert
+
+PAPLAY = "/usr/bin/paplay"
+WARNING_SOUND = "/usr/share/sounds/freedesktop/stereo/dialog-warning.oga"
+
+
+class ResolveAlertCommandTest(unittest.TestCase):
+    def setUp(self) -> None:
+        alert._resolve_alert_command.cache_clear()
+        self.addCleanup(alert._resolve_alert_command.cache_clear)
+
+    def _resolve(
+        self,
+        sound: str,
+        sound_file: str | None,
+        players: dict[str, str | None],
+        existing: set[str],
+        system: str = "Linux",
+    ) -> tuple[str, str] | None:
+        with mock.patch.object(alert, "_SYSTEM", system), mock.patch.dict(
+            alert._PLAYER_PATHS, players
+        ), mock.patch.object(alert.os.path, "exists", side_effect=existing.__contains__):
+            return alert._resolve_alert_command(sound, sound_file)
+
+    def test_prefers_sound_specific_freedesktop_file(self) -> None:
+        command = self._resolve(
+            "exclamation",
+            None,
+            {"afplay": None, "paplay": PAPLAY, "aplay": None},
+            {WARNING_SOUND},
+        )
+        self.assertEqual(command, ("paplay", WARNING_SOUND))
+
+    def test_custom_sound_file_comes_first(self) -> None:
+        command = self._resolve(
+            "exclamation",
+            "/tmp/alert.wav",
+            {"afplay": None, "paplay": PAPLAY, "aplay": None},
+            {"/tmp/alert.wav", WARNING_SOUND},
+        )
+        self.assertEqual(command, ("paplay", "/tmp/alert.wav"))
+
+    def test_skips_players_missing_from_path(self) -> None:
+        command = self._resolve(
+            "exclamation",
+            None,
+            {"afplay": None, "paplay": None, "aplay": "/usr/bin/aplay"},
+            {WARNING_SOUND, "/usr/share/sounds/alsa/Front_Center.wav"},
+        )
+        self.assertEqual(command, ("aplay", "/usr/share/sounds/alsa/Front_Center.wav"))
+
+    def test_uses_afplay_system_sound_on_macos(self) -> None:
+        command = self._resolve(
+            "ping",
+            None,
+            {"afplay": "/usr/bin/afplay", "paplay": None, "aplay": None},
+            {"/System/Library/Sounds/Ping.aiff"},
+            system="Darwin",
+        )
+        self.assertEqual(command, ("afplay", "/System/Library/Sounds/Ping.aiff"))
+
+    def test_returns_none_without_player_or_sound_file(self) -> None:
+        command = self._resolve(
+            "exclamation",
+            None,
+            {"afplay": None, "paplay": None, "aplay": None},
+            {WARNING_SOUND},
+        )
+        self.assertIsNone(command)
+
+
+class StartAlertProcessTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._reset_process_state()
+        self.addCleanup(self._reset_process_state)
+        patcher = mock.patch.dict(
+            alert._PLAYER_PATHS, {"afplay": None, "paplay": PAPLAY, "aplay": None}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _reset_process_state() -> None:
+        alert._ALERT_PID = None
+        alert._ALERT_PROCESS = None
+
+    def test_missing_player_is_not_spawned(self) -> None:
+        with mock.patch.object(alert.os, "posix_spawn", create=True) as spawn:
+            self.assertFalse(alert._start_alert_process("aplay", "/tmp/alert.wav"))
+        spawn.assert_not_called()
+
+    def test_spawns_player_with_output_silenced(self) -> None:
+        with mock.patch.object(alert.os, "posix_spawn", create=True, return_value=4321) as spawn:
+            self.assertTrue(alert._start_alert_process("paplay", WARNING_SOUND))
+
+        spawn.assert_called_once()
+        args, kwargs = spawn.call_args
+        self.assertEqual(args[0], PAPLAY)
+        self.assertEqual(args[1], ["paplay", WARNING_SOUND])
+        self.assertEqual(
+            [(action[1], action[2]) for action in kwargs["file_actions"]],
+            [(1, os.devnull), (2, os.devnull)],
+        )
+        self.assertEqual(alert._ALERT_PID, 4321)
+
+    def test_skips_spawn_while_player_is_running(self) -> None:
+        alert._ALERT_PID = 4321
+        with mock.patch.object(alert.os, "posix_spawn", create=True) as spawn, mock.patch.object(
+            alert.os, "waitpid", create=True, return_value=(0, 0)
+        ) as waitpid:
+            self.assertTrue(alert._start_alert_process("paplay", WARNING_SOUND))
+
+        waitpid.assert_called_once_with(4321, alert.os.WNOHANG)
+        spawn.assert_not_called()
+        self.assertEqual(alert._ALERT_PID, 4321)
+
+    def test_reaps_finished_player_before_spawning_again(self) -> None:
+        alert._ALERT_PID = 4321
+        with mock.patch.object(
+            alert.os, "posix_spawn", create=True, return_value=5678
+        ) as spawn, mock.patch.object(alert.os, "waitpid", create=True, return_value=(4321, 0)):
+            self.assertTrue(alert._start_alert_process("paplay", WARNING_SOUND))
+
+        spawn.assert_called_once()
+        self.assertEqual(alert._ALERT_PID, 5678)
+
+    def test_already_reaped_player_counts_as_finished(self) -> None:
+        alert._ALERT_PID = 4321
+        with mock.patch.object(
+            alert.os, "posix_spawn", create=True, return_value=5678
+        ) as spawn, mock.patch.object(
+            alert.os, "waitpid", create=True, side_effect=ChildProcessError
+        ):
+            self.assertTrue(alert._start_alert_process("paplay", WARNING_SOUND))
+
+        spawn.assert_called_once()
+        self.assertEqual(alert._ALERT_PID, 5678)
+
+    def test_spawn_failure_reports_false(self) -> None:
+        with mock.patch.object(alert.os, "posix_spawn", create=True, side_effect=OSError):
+            self.assertFalse(alert._start_alert_process("paplay", WARNING_SOUND))
+        self.assertIsNone(alert._ALERT_PID)
+
+    def test_falls_back_to_popen_without_posix_spawn(self) -> None:
+        self._hide_posix_spawn()
+        process = mock.Mock()
+        process.poll.return_value = None
+        with mock.patch.object(alert.subprocess, "Popen", return_value=process) as popen:
+            self.assertTrue(alert._start_alert_process("paplay", WARNING_SOUND))
+            # The first player is still running, so no second one starts.
+            self.assertTrue(alert._start_alert_process("paplay", WARNING_SOUND))
+            self.assertEqual(popen.call_count, 1)
+
+            process.poll.return_value = 0
+            self.assertTrue(alert._start_alert_process("paplay", WARNING_SOUND))
+            self.assertEqual(popen.call_count, 2)
+
+        popen.assert_called_with(
+            [PAPLAY, WARNING_SOUND],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.assertIs(alert._ALERT_PROCESS, process)
+
+    def _hide_posix_spawn(self) -> None:
+        if not hasattr(alert.os, "posix_spawn"):
+            return
+        posix_spawn = alert.os.posix_spawn
+        del alert.os.posix_spawn
+        self.addCleanup(setattr, alert.os, "posix_spawn", posix_spawn)
+
+
+class PlayAlertSoundTest(unittest.TestCase):
+    def test_silent_sound_does_nothing(self) -> None:
+        with mock.patch.object(alert, "_resolve_alert_command") as resolve:
+            alert.play_alert_sound("none")
+        resolve.assert_not_called()
+
+    def test_starts_resolved_player(self) -> None:
+        resolve = mock.patch.object(
+            alert, "_resolve_alert_command", return_value=("paplay", WARNING_SOUND)
+        )
+        with mock.patch.object(alert, "_SYSTEM", "Linux"), resolve, mock.patch.object(
+            alert, "_start_alert_process", return_value=True
+        ) as start, mock.patch.object(alert.sys, "stdout") as stdout:
+            alert.play_alert_sound("Exclamation", " ")
+
+        start.assert_called_once_with("paplay", WARNING_SOUND)
+        stdout.write.assert_not_called()
+
+    def test_rings_terminal_bell_without_player(self) -> None:
+        with mock.patch.object(alert, "_SYSTEM", "Linux"), mock.patch.object(
+            alert, "_resolve_alert_command", return_value=None
+        ), mock.patch.object(alert.sys, "stdout") as stdout:
+            alert.play_alert_sound("exclamation")
+
+        stdout.write.assert_called_once_with("\a")
+
+
+class PlayWindowsSoundTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.winsound = SimpleNamespace(
+            SND_FILENAME=1,
+            SND_ALIAS=2,
+            SND_ASYNC=4,
+            MB_ICONEXCLAMATION=10,
+            MB_ICONASTERISK=11,
+            MB_ICONHAND=12,
+            MB_ICONQUESTION=13,
+            PlaySound=mock.Mock(),
+            MessageBeep=mock.Mock(),
+            Beep=mock.Mock(),
+        )
+        patcher = mock.patch.object(alert, "winsound", self.winsound)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_returns_false_without_winsound(self) -> None:
+        with mock.patch.object(alert, "winsound", None):
+            self.assertFalse(alert._play_windows_sound("exclamation", None))
+
+    def test_plays_existing_custom_file_async(self) -> None:
+        with mock.patch.object(alert.os.path, "exists", return_value=True):
+            self.assertTrue(alert._play_windows_sound("exclamation", "alert.wav"))
+        self.winsound.PlaySound.assert_called_once_with("alert.wav", 1 | 4)
+
+    def test_plays_system_alias_async(self) -> None:
+        self.assertTrue(alert._play_windows_sound("question", None))
+        self.winsound.PlaySound.assert_called_once_with("SystemQuestion", 2 | 4)
+
+    def test_falls_back_to_message_beep_when_alias_fails(self) -> None:
+        self.winsound.PlaySound.side_effect = RuntimeError
+        self.assertTrue(alert._play_windows_sound("hand", None))
+        self.winsound.MessageBeep.assert_called_once_with(12)
+
+    def test_beep_runs_on_a_thread(self) -> None:
+        with mock.patch.object(alert, "_ALERT_THREAD", None):
+            self.assertTrue(alert._play_windows_sound("beep", None))
+            alert._ALERT_THREAD.join(timeout=1.0)
+        self.assertEqual(self.winsound.Beep.call_count, 2)
+
+    def test_unknown_sound_uses_default_message_beep(self) -> None:
+        self.assertTrue(alert._play_windows_sound("glass", None))
+        self.winsound.MessageBeep.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,12 +2,15 @@ import argparse
 import unittest
 
 from blink_app.cli import (
+    _get_parser,
     ear_threshold_value,
+    non_negative_float,
     non_negative_int,
     parse_args,
     positive_float,
     positive_int,
 )
+from blink_app.constants import INFER_MAX_WIDTH, MOTION_THRESHOLD
 
 
 class CliParseArgsTest(unittest.TestCase):
@@ -44,12 +47,58 @@ class CliParseArgsTest(unittest.TestCase):
             parse_args(["--fps", "0"])
         self.assertEqual(context.exception.code, 2)
 
+    def test_capture_backend_choices(self) -> None:
+        self.assertEqual(parse_args([]).capture_backend, "auto")
+        args = parse_args(["--capture-backend", "gstreamer"])
+        self.assertEqual(args.capture_backend, "gstreamer")
+        with self.assertRaises(SystemExit) as context:
+            parse_args(["--capture-backend", "msmf"])
+        self.assertEqual(context.exception.code, 2)
+
+    def test_infer_fps_defaults_to_every_frame(self) -> None:
+        self.assertIsNone(parse_args([]).infer_fps)
+        self.assertEqual(parse_args(["--infer-fps", "15"]).infer_fps, 15.0)
+        with self.assertRaises(SystemExit) as context:
+            parse_args(["--infer-fps", "0"])
+        self.assertEqual(context.exception.code, 2)
+
+    def test_infer_width_defaults_to_constant(self) -> None:
+        self.assertEqual(parse_args([]).infer_width, INFER_MAX_WIDTH)
+        self.assertEqual(parse_args(["--infer-width", "480"]).infer_width, 480)
+        with self.assertRaises(SystemExit) as context:
+            parse_args(["--infer-width", "0"])
+        self.assertEqual(context.exception.code, 2)
+
+    def test_motion_gate_is_off_by_default(self) -> None:
+        self.assertEqual(MOTION_THRESHOLD, 0.0)
+        self.assertEqual(parse_args([]).motion_threshold, 0.0)
+        self.assertEqual(parse_args(["--motion-threshold", "3"]).motion_threshold, 3.0)
+        self.assertEqual(parse_args(["--motion-threshold", "0"]).motion_threshold, 0.0)
+        with self.assertRaises(SystemExit) as context:
+            parse_args(["--motion-threshold", "-1"])
+        self.assertEqual(context.exception.code, 2)
+
+    def test_refine_landmarks_defaults_to_false(self) -> None:
+        self.assertFalse(parse_args([]).refine_landmarks)
+        self.assertTrue(parse_args(["--refine-landmarks"]).refine_landmarks)
+
+    def test_no_display_defaults_to_false(self) -> None:
+        self.assertFalse(parse_args([]).no_display)
+        self.assertTrue(parse_args(["--no-display"]).no_display)
+
     def test_non_negative_int_rejects_invalid_values(self) -> None:
         with self.assertRaises(argparse.ArgumentTypeError):
             non_negative_int("abc")
         with self.assertRaises(argparse.ArgumentTypeError):
             non_negative_int("-1")
 
+    def test_non_negative_float_rejects_invalid_values(self) -> None:
+        self.assertEqual(non_negative_float("0"), 0.0)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            non_negative_float("abc")
+        with self.assertRaises(argparse.ArgumentTypeError):
+            non_negative_float("-0.5")
+
     def test_positive_int_rejects_invalid_values(self) -> None:
         with self.assertRaises(argparse.ArgumentTypeError):
             positive_int("abc")
@@ -65,6 +114,13 @@ class CliParseArgsTest(unittest.TestCase):
     def test_ear_threshold_value_accepts_in_range_value(self) -> None:
         self.assertEqual(ear_threshold_value("0.25"), 0.25)
 
+    def test_parser_is_built_once(self) -> None:
+        parse_args([])
+        parser = _get_parser()
+        parse_args(["--enable-alerts"])
+        self.assertIs(_get_parser(), parser)
+        self.assertFalse(parse_args([]).enable_alerts)
+
     def test_version_exits_cleanly(self) -> None:
         with self.assertRaises(SystemExit) as context:
             parse_args(["--version"])
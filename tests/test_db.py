@@ -1,12 +1,19 @@
+import os
+import tempfile
 import unittest
 from datetime import datetime
 
 from blink_app.services.db import (
+    COUNT_BLINKS_SQL,
     count_blinks_in_range,
     fetch_recent_aggregates,
+    fill_minute_rollups,
+    flush_blink_events,
+    format_timestamp,
     init_db,
     record_aggregate,
     record_blink_event,
+    transaction,
 )
 
 
@@ -27,6 +34,21 @@ class DatabaseAggregatesTest(unittest.TestCase):
         self.assertIsNotNone(row)
         self.assertEqual(row[0], 7)
 
+    def test_record_aggregate_accepts_preformatted_timestamps(self) -> None:
+        db_conn = init_db(":memory:")
+        try:
+            record_aggregate(
+                db_conn,
+                "minute",
+                "2024-01-01 10:00:00",
+                "2024-01-01 10:00:59",
+                3,
+            )
+            rows = fetch_recent_aggregates(db_conn, "minute", limit=1)
+        finally:
+            db_conn.close()
+        self.assertEqual(rows, [("2024-01-01 10:00:00", 3)])
+
     def test_count_blinks_in_range_is_inclusive(self) -> None:
         db_conn = init_db(":memory:")
         start = datetime(2024, 1, 1, 10, 0, 0)
@@ -40,6 +62,18 @@ class DatabaseAggregatesTest(unittest.TestCase):
         count = count_blinks_in_range(db_conn, start, end)
         self.assertEqual(count, 3)
 
+    def test_count_blinks_in_range_uses_covering_index(self) -> None:
+        db_conn = init_db(":memory:")
+        try:
+            rows = db_conn.execute(
+                "EXPLAIN QUERY PLAN " + COUNT_BLINKS_SQL,
+                ("2024-01-01 10:00:00", "2024-01-01 10:01:00"),
+            ).fetchall()
+        finally:
+            db_conn.close()
+        plan = " ".join(str(row[-1]) for row in rows)
+        self.assertIn("COVERING INDEX idx_blink_events_time", plan)
+
     def test_fetch_recent_aggregates_applies_limit_and_order(self) -> None:
         db_conn = init_db(":memory:")
         base_start = datetime(2024, 1, 1, 10, 0, 0)
@@ -55,6 +89,124 @@ class DatabaseAggregatesTest(unittest.TestCase):
         self.assertEqual(rows[1][0], "2024-01-01 10:03:00")
         self.assertEqual(rows[2][0], "2024-01-01 10:02:00")
 
+    def test_record_blink_event_buffers_until_flush(self) -> None:
+        db_conn = init_db(":memory:")
+        try:
+            record_blink_event(db_conn, datetime(2024, 1, 1, 10, 0, 0))
+            record_blink_event(db_conn, datetime(2024, 1, 1, 10, 0, 1))
+
+            row = db_conn.execute("SELECT COUNT(*) FROM blink_events").fetchone()
+            self.assertEqual(row[0], 0)
+            self.assertEqual(len(db_conn.pending_events), 2)
+
+            flush_blink_events(db_conn)
+            row = db_conn.execute("SELECT COUNT(*) FROM blink_events").fetchone()
+            self.assertEqual(row[0], 2)
+            self.assertEqual(db_conn.pending_events, [])
+        finally:
+            db_conn.close()
+
+    def test_transaction_rolls_back_on_error(self) -> None:
+        db_conn = init_db(":memory:")
+        try:
+            with self.assertRaises(RuntimeError):
+                with transaction(db_conn):
+                    db_conn.execute(
+                        "INSERT INTO blink_events (event_time) VALUES (?)",
+                        ("2024-01-01 10:00:00",),
+                    )
+                    raise RuntimeError("boom")
+
+            row = db_conn.execute("SELECT COUNT(*) FROM blink_events").fetchone()
+            self.assertEqual(row[0], 0)
+            self.assertFalse(db_conn.in_transaction)
+        finally:
+            db_conn.close()
+
+    def test_fill_minute_rollups_groups_events_by_minute(self) -> None:
+        db_conn = init_db(":memory:")
+        try:
+            record_blink_event(db_conn, datetime(2024, 1, 1, 10, 0, 5))
+            record_blink_event(db_conn, datetime(2024, 1, 1, 10, 0, 59))
+            record_blink_event(db_conn, datetime(2024, 1, 1, 10, 2, 0))
+            record_blink_event(db_conn, datetime(2024, 1, 1, 10, 3, 0))
+            record_aggregate(
+                db_conn,
+                "minute",
+                datetime(2024, 1, 1, 10, 0, 0),
+                datetime(2024, 1, 1, 10, 0, 59),
+                7,
+            )
+
+            written = fill_minute_rollups(
+                db_conn,
+                datetime(2024, 1, 1, 10, 0, 0),
+                datetime(2024, 1, 1, 10, 3, 0),
+            )
+
+            self.assertEqual(written, 2)
+            rows = db_conn.execute(
+                "SELECT interval_start, interval_end, blink_count "
+                "FROM blink_aggregates WHERE interval_type = 'minute' "
+                "ORDER BY interval_start"
+            ).fetchall()
+            self.assertEqual(
+                rows,
+                [
+                    ("2024-01-01 10:00:00", "2024-01-01 10:00:59", 2),
+                    ("2024-01-01 10:02:00", "2024-01-01 10:02:59", 1),
+                ],
+            )
+        finally:
+            db_conn.close()
+
+    def test_background_writer_commits_events_off_the_caller_connection(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_conn = init_db(os.path.join(tmp_dir, "blinks.db"), background_writes=True)
+            try:
+                writer = db_conn.event_writer
+                self.assertIsNotNone(writer)
+                self.assertTrue(writer.thread.is_alive())
+
+                record_blink_event(db_conn, datetime(2024, 1, 1, 10, 0, 0))
+                count = count_blinks_in_range(
+                    db_conn,
+                    datetime(2024, 1, 1, 10, 0, 0),
+                    datetime(2024, 1, 1, 10, 0, 0),
+                )
+                self.assertEqual(count, 1)
+
+                record_blink_event(db_conn, datetime(2024, 1, 1, 10, 0, 1))
+            finally:
+                db_conn.close()
+            self.assertFalse(writer.thread.is_alive())
+
+            db_conn = init_db(os.path.join(tmp_dir, "blinks.db"))
+            try:
+                row = db_conn.execute("SELECT COUNT(*) FROM blink_events").fetchone()
+                self.assertEqual(row[0], 2)
+            finally:
+                db_conn.close()
+
+    def test_format_timestamp_matches_strftime(self) -> None:
+        value = datetime(2024, 1, 2, 3, 4, 5, 678901)
+        self.assertEqual(format_timestamp(value), value.strftime("%Y-%m-%d %H:%M:%S"))
+        self.assertEqual(format_timestamp("2024-01-02 03:04:05"), "2024-01-02 03:04:05")
+
+    def test_close_flushes_pending_blink_events(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "blinks.db")
+            db_conn = init_db(db_path)
+            record_blink_event(db_conn, datetime(2024, 1, 1, 10, 0, 0))
+            db_conn.close()
+
+            db_conn = init_db(db_path)
+            try:
+                row = db_conn.execute("SELECT COUNT(*) FROM blink_events").fetchone()
+                self.assertEqual(row[0], 1)
+            finally:
+                db_conn.close()
+
 
 if __name__ == "__main__":
     unittest.main()
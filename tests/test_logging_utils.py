@@ -1,13 +1,16 @@
 import logging
+import logging.handlers
 import os
 import tempfile
 import unittest
 
-from blink_app.services.logging_utils import setup_logging
+from blink_app.services import logging_utils
+from blink_app.services.logging_utils import setup_logging, stop_logging
 
 
 class LoggingSetupTest(unittest.TestCase):
     def tearDown(self) -> None:
+        stop_logging()
         self._reset_logger("app")
         self._reset_logger("blink_events")
         self._reset_logger("aggregate_metrics")
@@ -39,22 +42,51 @@ class LoggingSetupTest(unittest.TestCase):
             self._reset_logger("blink_events")
             self._reset_logger("aggregate_metrics")
 
+    def test_setup_logging_skips_thread_and_process_capture(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            app_logger, _, _ = setup_logging(tmp_dir)
+            record = app_logger.makeRecord("app", logging.INFO, __file__, 0, "msg", (), None)
+
+            self.assertIsNone(record.thread)
+            self.assertIsNone(record.process)
+            self._reset_logger("app")
+            self._reset_logger("blink_events")
+            self._reset_logger("aggregate_metrics")
+
+    def test_stop_logging_flushes_queued_records(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            _, blink_logger, _ = setup_logging(tmp_dir)
+            blink_logger.info("Blink #%d", 7)
+            stop_logging()
+
+            with open(os.path.join(tmp_dir, "blink_events.log"), encoding="utf-8") as handle:
+                self.assertIn("Blink #7", handle.read())
+            self._reset_logger("app")
+            self._reset_logger("blink_events")
+            self._reset_logger("aggregate_metrics")
+
     def _assert_logger_has_expected_handlers(self, logger: logging.Logger) -> None:
-        self.assertEqual(len(logger.handlers), 2)
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], logging.handlers.QueueHandler)
+        listener_handlers = self._listener_handlers(logger)
+        self.assertEqual(len(listener_handlers), 2)
         console_handlers = [
             handler
-            for handler in logger.handlers
+            for handler in listener_handlers
             if isinstance(handler, logging.StreamHandler)
             and not isinstance(handler, logging.FileHandler)
         ]
         file_handlers = [
             handler
-            for handler in logger.handlers
+            for handler in listener_handlers
             if isinstance(handler, logging.FileHandler)
         ]
         self.assertEqual(len(console_handlers), 1)
         self.assertEqual(len(file_handlers), 1)
 
+    def _listener_handlers(self, logger: logging.Logger) -> tuple[logging.Handler, ...]:
+        return logging_utils._listeners[logger.name].handlers
+
     def _reset_logger(self, name: str) -> None:
         logger = logging.getLogger(name)
         for handler in list(logger.handlers):